@@ -24,11 +24,11 @@ from .schemas import (
     BrandTier, WearContext, Climate,
     clamp, score_to_ten, rescale_display,
 )
-from .kridha_engine import score_garment
+from .kridha_engine import score_garment, score_garments_batch, make_scorer
 from .garment_types import classify_garment
 
 __all__ = [
-    "score_garment", "classify_garment",
+    "score_garment", "score_garments_batch", "make_scorer", "classify_garment",
     "BodyProfile", "GarmentProfile", "ScoreResult",
     "PrincipleResult", "GoalVerdict", "ZoneScore",
     "ExceptionTriggered", "Fix", "BodyAdjustedGarment",
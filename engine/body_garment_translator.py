@@ -10,8 +10,9 @@ Source: Domain 2 Part III-A (hemline), Part III-B (sleeve), Part VIII (scoring).
 """
 
 import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 from .schemas import (
     BodyProfile, GarmentProfile, BodyAdjustedGarment,
@@ -22,17 +23,21 @@ from .rules_data import (
     HEM_TYPE_MODIFIERS, SHOULDER_WIDTH_MODIFIERS, HEEL_EFFICIENCY,
     PROPORTION_CUT_RATIOS,
 )
+from .fabric_gate import ResolvedFabric, resolve_fabric_properties
+
+# Width = circumference / pi; multiply by the reciprocal instead of dividing.
+_INV_PI = 1.0 / math.pi
 
 
 # ================================================================
 # HEMLINE TRANSLATION (Domain 2 Part III-A, lines ~2000-2940)
 # ================================================================
 
-@dataclass
+@dataclass(slots=True)
 class HemlineResult:
     hem_from_floor: float
     hem_zone: str
-    danger_zones: List[Tuple[float, float]]  # [(low, high), ...]
+    danger_zones: Tuple[Tuple[float, float], ...]  # ((low, high), ...)
     safe_zone: Optional[Tuple[float, float]]
     safe_zone_size: float
     fabric_rise: float                       # inches hem rises from stated
@@ -40,19 +45,35 @@ class HemlineResult:
     narrowest_point_bonus: float
 
 
+# Hem label → (body landmark attribute, offset in inches). A landmark of
+# None means the offset is an absolute height from the floor.
+_HEM_LABEL_LANDMARKS = {
+    "mini": ("h_knee", 6),
+    "above_knee": ("h_knee", 3),
+    "knee": ("h_knee", 0),
+    "below_knee": ("h_knee", -3),
+    "midi": ("h_calf_max", 0),
+    "below_calf": ("h_calf_min", 0),
+    "ankle": ("h_ankle", 2),
+    "floor": (None, 1.0),
+}
+
+
 def _hem_label_to_height(label: str, body: BodyProfile) -> float:
     """Convert a hem label to height-from-floor (domain 2 line ~10091)."""
-    mapping = {
-        "mini": body.h_knee + 6,
-        "above_knee": body.h_knee + 3,
-        "knee": body.h_knee,
-        "below_knee": body.h_knee - 3,
-        "midi": body.h_calf_max,
-        "below_calf": body.h_calf_min,
-        "ankle": body.h_ankle + 2,
-        "floor": 1.0,
-    }
-    return mapping.get(label, body.h_knee)
+    entry = _HEM_LABEL_LANDMARKS.get(label)
+    if entry is None:
+        return body.h_knee
+    landmark, offset = entry
+    if landmark is None:
+        return offset
+    return getattr(body, landmark) + offset
+
+
+# Hem ride-up tables for fabric_drape_adjustment
+_FLARE_SILHOUETTES = frozenset({Silhouette.A_LINE, Silhouette.FIT_AND_FLARE})
+_DRAPE_BASE_RISE = {Silhouette.FITTED: 0.5}
+_DRAPE_WEIGHT_MULTIPLIERS = {"light": 1.3, "heavy": 0.7}
 
 
 def fabric_drape_adjustment(
@@ -66,24 +87,14 @@ def fabric_drape_adjustment(
 
     Returns inches of ride-up.
     """
-    rise = 0.0
-
-    # A-line / flared silhouettes ride up over prominent hips
-    if silhouette in (Silhouette.A_LINE, Silhouette.FIT_AND_FLARE):
-        if hip_circ > 40:
-            rise += 1.0
-        if stomach_projection > 2:
-            rise += 0.5
-
-    # Fitted/bodycon ride up with movement
-    if silhouette == Silhouette.FITTED:
-        rise += 0.5
+    # Fitted/bodycon ride up with movement; A-line / flared silhouettes
+    # ride up over prominent hips
+    rise = _DRAPE_BASE_RISE.get(silhouette, 0.0)
+    if silhouette in _FLARE_SILHOUETTES:
+        rise += (1.0 if hip_circ > 40 else 0.0) + (0.5 if stomach_projection > 2 else 0.0)
 
     # Fabric weight modifier
-    if fabric_weight == "light":
-        rise *= 1.3
-    elif fabric_weight == "heavy":
-        rise *= 0.7
+    rise *= _DRAPE_WEIGHT_MULTIPLIERS.get(fabric_weight, 1.0)
 
     return rise
 
@@ -91,16 +102,24 @@ def fabric_drape_adjustment(
 def translate_hemline(garment: GarmentProfile, body: BodyProfile) -> HemlineResult:
     """Full hemline translation: position, danger zones, safe zone."""
 
+    # Body landmarks are read once; properties like calf_prominence are
+    # derived on every access.
+    height = body.height
+    h_knee = body.h_knee
+    h_ankle = body.h_ankle
+    h_calf_min = body.h_calf_min
+    gsm = garment.gsm_estimated
+
     # Step 1: Compute hem_from_floor
     if garment.garment_length_inches is not None:
-        scale = body.height / 66.0  # reference model height 66"
-        hem_from_floor = body.height - (garment.garment_length_inches * scale)
+        scale = height / 66.0  # reference model height 66"
+        hem_from_floor = height - (garment.garment_length_inches * scale)
     else:
         hem_from_floor = _hem_label_to_height(garment.hem_position, body)
 
     # Step 2: Fabric drape adjustment
-    fabric_weight = "light" if garment.gsm_estimated < 120 else (
-        "heavy" if garment.gsm_estimated > 280 else "medium"
+    fabric_weight = "light" if gsm < 120 else (
+        "heavy" if gsm > 280 else "medium"
     )
     rise = fabric_drape_adjustment(
         garment.silhouette, fabric_weight,
@@ -111,7 +130,7 @@ def translate_hemline(garment: GarmentProfile, body: BodyProfile) -> HemlineResu
 
     # Step 3: Danger zones
     # Knee danger zone (domain 2)
-    knee_center = body.h_knee
+    knee_center = h_knee
     knee_danger = (knee_center - 1.0, knee_center + 1.5)
 
     # Calf danger zone
@@ -121,10 +140,10 @@ def translate_hemline(garment: GarmentProfile, body: BodyProfile) -> HemlineResu
     calf_danger = (calf_widest - calf_danger_radius, calf_widest + calf_danger_radius)
 
     # Thigh danger zone
-    thigh_widest_h = body.h_knee + 6  # approximate: ~6" above knee
+    thigh_widest_h = h_knee + 6  # approximate: ~6" above knee
     thigh_danger = (thigh_widest_h - 1.0, thigh_widest_h + 1.0)
 
-    danger_zones = [thigh_danger, knee_danger, calf_danger]
+    danger_zones = (thigh_danger, knee_danger, calf_danger)
 
     # Step 4: Safe zone (between knee danger bottom and calf danger top)
     safe_zone_top = knee_danger[0]     # bottom of knee danger
@@ -142,27 +161,25 @@ def translate_hemline(garment: GarmentProfile, body: BodyProfile) -> HemlineResu
         hem_zone = "above_knee_near"
     elif hem_from_floor >= knee_danger[0]:
         hem_zone = "knee_danger"
-    elif safe_zone_size > 0 and hem_from_floor > calf_danger[1]:
-        hem_zone = "safe_zone"
-    elif safe_zone_size <= 0 and hem_from_floor > calf_danger[1]:
-        hem_zone = "collapsed_zone"
+    elif hem_from_floor > calf_danger[1]:
+        hem_zone = "safe_zone" if safe_zone_size > 0 else "collapsed_zone"
     elif hem_from_floor >= calf_danger[0]:
         hem_zone = "calf_danger"
-    elif hem_from_floor > body.h_ankle + 2:
+    elif hem_from_floor > h_ankle + 2:
         hem_zone = "below_calf"
-    elif hem_from_floor > body.h_ankle - 1:
+    elif hem_from_floor > h_ankle - 1:
         hem_zone = "ankle"
     else:
         hem_zone = "floor"
 
     # Step 6: Proportion cut ratio
-    cut_ratio = hem_from_floor / body.height if body.height > 0 else 0.3
+    cut_ratio = hem_from_floor / height if height > 0 else 0.3
 
     # Step 7: Narrowest-point bonus
     narrowest_bonus = 0.0
     narrow_points = {
-        "ankle": {"height": body.h_ankle + 2, "bonus": 2},
-        "lower_calf": {"height": body.h_calf_min, "bonus": 1},
+        "ankle": {"height": h_ankle + 2, "bonus": 2},
+        "lower_calf": {"height": h_calf_min, "bonus": 1},
     }
     for _name, point in narrow_points.items():
         if abs(hem_from_floor - point["height"]) <= 1.5:
@@ -184,7 +201,7 @@ def translate_hemline(garment: GarmentProfile, body: BodyProfile) -> HemlineResu
 # SLEEVE TRANSLATION (Domain 2 Part III-B, lines ~3126-4400)
 # ================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SleeveResult:
     endpoint_position: float              # inches from shoulder
     perceived_width: float                # inches
@@ -196,18 +213,12 @@ class SleeveResult:
     shoulder_width_effect: float          # inches per side
 
 
-def _interpolate_arm_circ(body: BodyProfile, position: float) -> float:
+def _interpolate_arm_circ(
+    landmarks: Tuple[Tuple[float, float], ...], position: float
+) -> float:
     """Piecewise linear interpolation of arm circumference at a given
-    position (inches from shoulder). Domain 2 line ~3213."""
-    landmarks = [
-        (0.0, body.shoulder_width / 2 * math.pi / 2),  # shoulder ~14-18" circ
-        (body.c_upper_arm_max_position, body.c_upper_arm_max),
-        (body.arm_length * 0.52, body.c_elbow),            # ~12" from shoulder
-        (body.arm_length * 0.65, body.c_forearm_max),
-        (body.c_forearm_min_position, body.c_forearm_min),
-        (body.arm_length, body.c_wrist),
-    ]
-
+    position (inches from shoulder), over BodyProfile.arm_landmarks.
+    Domain 2 line ~3213."""
     # Clamp position
     if position <= landmarks[0][0]:
         return landmarks[0][1]
@@ -224,7 +235,8 @@ def _interpolate_arm_circ(body: BodyProfile, position: float) -> float:
             t = (position - p0) / (p1 - p0)
             return c0 + t * (c1 - c0)
 
-    return body.c_upper_arm_max
+    # No bracket (landmarks out of order) — fall back to upper-arm max
+    return landmarks[1][1]
 
 
 def _arm_prominence_severity(body: BodyProfile) -> Tuple[float, float]:
@@ -248,29 +260,49 @@ def _arm_prominence_severity(body: BodyProfile) -> Tuple[float, float]:
         return 2.0, 3.0
 
 
+# SleeveType → (fixed_position, arm_length_factor, ease, hem_type).
+# Endpoint position = fixed_position + arm_length_factor * arm_length.
+_SLEEVE_POSITIONS = {
+    SleeveType.SLEEVELESS: (0.0, 0.0, 0.0, "clean_hem"),
+    SleeveType.CAP: (2.5, 0.0, -0.5, "clean_hem"),
+    SleeveType.SHORT: (6.0, 0.0, 1.0, "clean_hem"),
+    SleeveType.THREE_QUARTER: (17.0, 0.0, 0.5, "clean_hem"),
+    SleeveType.LONG: (0.0, 1.0, 0.0, "clean_hem"),
+    SleeveType.RAGLAN: (0.0, 1.0, 1.0, "clean_hem"),
+    SleeveType.DOLMAN: (0.0, 1.0, 12.0, "clean_hem"),
+    SleeveType.PUFF: (4.0, 0.0, 6.0, "elastic"),
+    SleeveType.FLUTTER: (3.0, 0.0, 3.0, "flutter"),
+    SleeveType.BELL: (0.0, 0.7, 8.0, "clean_hem"),
+    SleeveType.SET_IN: (0.0, 1.0, 1.0, "clean_hem"),
+}
+_DEFAULT_SLEEVE_POSITION = _SLEEVE_POSITIONS[SleeveType.SET_IN]
+
+
 def _sleeve_type_to_position(
     sleeve_type: SleeveType, body: BodyProfile
 ) -> Tuple[float, float, str]:
     """Map SleeveType enum to (endpoint_position, ease, hem_type)."""
-    _map = {
-        SleeveType.SLEEVELESS: (0.0, 0.0, "clean_hem"),
-        SleeveType.CAP: (2.5, -0.5, "clean_hem"),
-        SleeveType.SHORT: (6.0, 1.0, "clean_hem"),
-        SleeveType.THREE_QUARTER: (17.0, 0.5, "clean_hem"),
-        SleeveType.LONG: (body.arm_length, 0.0, "clean_hem"),
-        SleeveType.RAGLAN: (body.arm_length, 1.0, "clean_hem"),
-        SleeveType.DOLMAN: (body.arm_length, 12.0, "clean_hem"),
-        SleeveType.PUFF: (4.0, 6.0, "elastic"),
-        SleeveType.FLUTTER: (3.0, 3.0, "flutter"),
-        SleeveType.BELL: (body.arm_length * 0.7, 8.0, "clean_hem"),
-        SleeveType.SET_IN: (body.arm_length, 1.0, "clean_hem"),
-    }
-    return _map.get(sleeve_type, (body.arm_length, 1.0, "clean_hem"))
+    fixed, arm_factor, ease, hem_type = _SLEEVE_POSITIONS.get(
+        sleeve_type, _DEFAULT_SLEEVE_POSITION
+    )
+    if arm_factor:
+        return fixed + arm_factor * body.arm_length, ease, hem_type
+    return fixed, ease, hem_type
+
+
+# Perceived-width delta → raw sleeve score (domain 2 line ~4076).
+# A delta strictly above _DELTA_EDGES[i - 1] scores _DELTA_SCORES[i].
+_DELTA_EDGES = (-0.60, -0.30, 0.0, 0.15, 0.30)
+_DELTA_SCORES = (5.0, 3.0, 1.0, -1.0, -2.0, -4.0)
 
 
 def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult:
     """Full sleeve translation: endpoint, perceived width, score."""
 
+    arm_length = body.arm_length
+    upper_arm_max_position = body.c_upper_arm_max_position
+    arm_landmarks = body.arm_landmarks
+
     # Determine endpoint position
     if garment.sleeve_length_inches is not None:
         endpoint = garment.sleeve_length_inches
@@ -282,12 +314,12 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
         )
 
     # Arm circumference at endpoint
-    actual_circ = _interpolate_arm_circ(body, endpoint)
-    actual_width = actual_circ / math.pi
+    actual_circ = _interpolate_arm_circ(arm_landmarks, endpoint)
+    actual_width = actual_circ * _INV_PI
 
     # Perceived width (domain 2 line ~3310)
     if ease >= 0:
-        frame_width = actual_width + (ease / math.pi)
+        frame_width = actual_width + (ease * _INV_PI)
     elif ease > -1.0:
         # Slight compression
         compression = abs(ease)
@@ -302,11 +334,11 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
     frame_width += hem_mod
 
     # Taper impression (visible arm below sleeve contributes 40%)
-    if endpoint < body.arm_length:
+    if endpoint < arm_length:
         # Average visible arm width below sleeve
-        mid_visible = (endpoint + body.arm_length) / 2
-        visible_circ = _interpolate_arm_circ(body, mid_visible)
-        avg_visible_width = visible_circ / math.pi
+        mid_visible = (endpoint + arm_length) / 2
+        visible_circ = _interpolate_arm_circ(arm_landmarks, mid_visible)
+        avg_visible_width = visible_circ * _INV_PI
         taper_impression = (avg_visible_width - frame_width) * 0.4
     else:
         taper_impression = 0.0
@@ -316,8 +348,8 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
     # For very short sleeves (cap/short) near the arm's widest point,
     # the sleeve frames the danger zone — compare against widest arm width
     reference_width = actual_width
-    if endpoint <= body.c_upper_arm_max_position + 1.5:
-        widest_arm_width = body.c_upper_arm_max / math.pi
+    if endpoint <= upper_arm_max_position + 1.5:
+        widest_arm_width = body.c_upper_arm_max * _INV_PI
         cap_frame_delta = frame_width - widest_arm_width + 0.20
         delta = max(perceived_width - actual_width, cap_frame_delta)
     else:
@@ -327,18 +359,7 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
     severity, radius = _arm_prominence_severity(body)
 
     # Score from delta (domain 2 line ~4076)
-    if delta > 0.30:
-        score = -4.0
-    elif delta > 0.15:
-        score = -2.0
-    elif delta > 0:
-        score = -1.0
-    elif delta > -0.30:
-        score = 1.0
-    elif delta > -0.60:
-        score = 3.0
-    else:
-        score = 5.0
+    score = _DELTA_SCORES[bisect_left(_DELTA_EDGES, delta)]
 
     # Apply severity multiplier
     if score < 0:
@@ -347,8 +368,7 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
         score *= (1 + (severity - 1) * 0.5)
 
     # Shoulder width effect
-    sleeve_key = garment.sleeve_type.value if hasattr(garment.sleeve_type, 'value') else "set_in"
-    shoulder_effect = SHOULDER_WIDTH_MODIFIERS.get(sleeve_key, 0.0)
+    shoulder_effect = SHOULDER_WIDTH_MODIFIERS.get(garment.sleeve_type.value, 0.0)
 
     return SleeveResult(
         endpoint_position=endpoint,
@@ -366,7 +386,7 @@ def translate_sleeve(garment: GarmentProfile, body: BodyProfile) -> SleeveResult
 # WAISTLINE TRANSLATION (Domain 2 Part VIII, lines ~10418-10563)
 # ================================================================
 
-@dataclass
+@dataclass(slots=True)
 class WaistlineResult:
     visual_waist_height: float            # from floor
     visual_leg_ratio: float
@@ -417,7 +437,14 @@ def translate_waistline(
 # PROPORTION SHIFT (Domain 2: heel efficiency, shoe contrast)
 # ================================================================
 
-@dataclass
+# HEEL_EFFICIENCY bins sorted by lower bound, for bisect lookup
+_HEEL_BINS = sorted(HEEL_EFFICIENCY.items())
+_HEEL_EDGES = [lo for (lo, _hi), _eff in _HEEL_BINS]
+_HEEL_UPPER = [hi for (_lo, hi), _eff in _HEEL_BINS]
+_HEEL_EFF = [eff for _bounds, eff in _HEEL_BINS]
+
+
+@dataclass(slots=True)
 class ProportionResult:
     visual_leg_length: float
     heel_extension: float                 # effective inches added
@@ -435,10 +462,9 @@ def compute_proportion_shift(
 
     # Heel efficiency by tier
     efficiency = 0.70  # default
-    for (lo, hi), eff in HEEL_EFFICIENCY.items():
-        if lo <= heel_height_inches < hi:
-            efficiency = eff
-            break
+    idx = bisect_right(_HEEL_EDGES, heel_height_inches) - 1
+    if idx >= 0 and heel_height_inches < _HEEL_UPPER[idx]:
+        efficiency = _HEEL_EFF[idx]
 
     heel_extension = heel_height_inches * efficiency
 
@@ -464,45 +490,49 @@ def compute_proportion_shift(
 # MASTER TRANSLATION FUNCTION
 # ================================================================
 
+# Categories that have meaningful hemline interaction with legs
+_HEM_CATEGORIES = frozenset({
+    GarmentCategory.DRESS, GarmentCategory.SKIRT,
+    GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
+    GarmentCategory.COAT,
+})
+# Categories that have sleeves
+_SLEEVE_CATEGORIES = frozenset({
+    GarmentCategory.DRESS, GarmentCategory.TOP,
+    GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
+    GarmentCategory.JACKET, GarmentCategory.COAT,
+    GarmentCategory.SWEATSHIRT, GarmentCategory.CARDIGAN,
+    GarmentCategory.BODYSUIT, GarmentCategory.LOUNGEWEAR,
+    GarmentCategory.ACTIVEWEAR,
+    GarmentCategory.SAREE, GarmentCategory.SALWAR_KAMEEZ,
+    GarmentCategory.LEHENGA,
+})
+# Categories that define a waistline
+_WAIST_CATEGORIES = frozenset({
+    GarmentCategory.DRESS, GarmentCategory.JUMPSUIT,
+    GarmentCategory.ROMPER, GarmentCategory.COAT,
+    GarmentCategory.BOTTOM_PANTS, GarmentCategory.BOTTOM_SHORTS,
+    GarmentCategory.SKIRT,
+})
+
+
 def translate_garment_to_body(
     garment: GarmentProfile,
     body: BodyProfile,
+    resolved: Optional[ResolvedFabric] = None,
 ) -> BodyAdjustedGarment:
-    """Run Piece 2 translations appropriate for this garment type."""
+    """Run Piece 2 translations appropriate for this garment type.
 
-    from .fabric_gate import resolve_fabric_properties
+    Pass ``resolved`` when the caller has already run
+    resolve_fabric_properties() for this garment to avoid resolving twice.
+    """
 
     category = garment.category
 
-    # Categories that have meaningful hemline interaction with legs
-    _HEM_CATEGORIES = {
-        GarmentCategory.DRESS, GarmentCategory.SKIRT,
-        GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
-        GarmentCategory.COAT,
-    }
-    # Categories that have sleeves
-    _SLEEVE_CATEGORIES = {
-        GarmentCategory.DRESS, GarmentCategory.TOP,
-        GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
-        GarmentCategory.JACKET, GarmentCategory.COAT,
-        GarmentCategory.SWEATSHIRT, GarmentCategory.CARDIGAN,
-        GarmentCategory.BODYSUIT, GarmentCategory.LOUNGEWEAR,
-        GarmentCategory.ACTIVEWEAR,
-        GarmentCategory.SAREE, GarmentCategory.SALWAR_KAMEEZ,
-        GarmentCategory.LEHENGA,
-    }
-    # Categories that define a waistline
-    _WAIST_CATEGORIES = {
-        GarmentCategory.DRESS, GarmentCategory.JUMPSUIT,
-        GarmentCategory.ROMPER, GarmentCategory.COAT,
-        GarmentCategory.BOTTOM_PANTS, GarmentCategory.BOTTOM_SHORTS,
-        GarmentCategory.SKIRT,
-    }
-
     # Hemline — only for categories where hem interacts with leg landmarks
     hem_from_floor = 0.0
     hem_zone = ""
-    danger_zones = []
+    danger_zones = ()
     safe_zone = None
     fabric_rise = 0.0
     if category in _HEM_CATEGORIES:
@@ -535,8 +565,9 @@ def translate_garment_to_body(
         visual_leg_ratio = waist.visual_leg_ratio
         proportion_improvement = waist.proportion_improvement
 
-    # Fabric resolution always runs
-    resolved = resolve_fabric_properties(garment)
+    # Fabric resolution always runs (unless the caller already did it)
+    if resolved is None:
+        resolved = resolve_fabric_properties(garment)
 
     return BodyAdjustedGarment(
         hem_from_floor=hem_from_floor,
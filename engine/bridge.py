@@ -6,11 +6,13 @@ Converts the Node.js pipeline's output (Vineeth's merged garment attributes
 GarmentProfile dataclasses.
 """
 
+import functools
 import json
 import logging
 import os
 import re
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
 from .schemas import (
@@ -34,8 +36,10 @@ CM_TO_IN = 1 / 2.54
 # ================================================================
 # ENUM MAPPING TABLES
 # ================================================================
+# Read-only views: these tables are shared by every request and must
+# never be mutated at runtime.
 
-NECKLINE_MAP = {
+NECKLINE_MAP = MappingProxyType({
     "v_neck": NecklineType.V_NECK,
     "crew_neck": NecklineType.CREW,
     "scoop_neck": NecklineType.SCOOP,
@@ -57,9 +61,9 @@ NECKLINE_MAP = {
     "mandarin": NecklineType.TURTLENECK,
     "henley": NecklineType.CREW,
     "asymmetric": NecklineType.SCOOP,
-}
+})
 
-SILHOUETTE_MAP = {
+SILHOUETTE_MAP = MappingProxyType({
     "a_line": Silhouette.A_LINE,
     "fit_and_flare": Silhouette.FIT_AND_FLARE,
     "sheath": Silhouette.FITTED,
@@ -76,9 +80,9 @@ SILHOUETTE_MAP = {
     "dropped_waist": Silhouette.SHIFT,
     "tiered": Silhouette.A_LINE,
     "asymmetric": Silhouette.SEMI_FITTED,
-}
+})
 
-SLEEVE_MAP = {
+SLEEVE_MAP = MappingProxyType({
     "sleeveless": SleeveType.SLEEVELESS,
     "spaghetti_strap": SleeveType.SLEEVELESS,
     "cap": SleeveType.CAP,
@@ -97,16 +101,16 @@ SLEEVE_MAP = {
     "lantern": SleeveType.PUFF,
     "leg_of_mutton": SleeveType.PUFF,
     "off_shoulder": SleeveType.SLEEVELESS,
-}
+})
 
-SHEEN_MAP = {
+SHEEN_MAP = MappingProxyType({
     "matte": SurfaceFinish.MATTE,
     "subtle_sheen": SurfaceFinish.SUBTLE_SHEEN,
     "moderate_sheen": SurfaceFinish.MODERATE_SHEEN,
     "shiny": SurfaceFinish.HIGH_SHINE,
-}
+})
 
-CATEGORY_MAP = {
+CATEGORY_MAP = MappingProxyType({
     "dress": GarmentCategory.DRESS,
     "top": GarmentCategory.TOP,
     "blouse": GarmentCategory.TOP,
@@ -120,9 +124,9 @@ CATEGORY_MAP = {
     "cardigan": GarmentCategory.CARDIGAN,
     "sweater": GarmentCategory.SWEATSHIRT,
     "shorts": GarmentCategory.BOTTOM_SHORTS,
-}
+})
 
-COLOR_LIGHTNESS_MAP = {
+COLOR_LIGHTNESS_MAP = MappingProxyType({
     "very_dark": 0.10,
     "dark": 0.20,
     "medium_dark": 0.35,
@@ -130,53 +134,53 @@ COLOR_LIGHTNESS_MAP = {
     "medium_light": 0.65,
     "light": 0.80,
     "very_light": 0.90,
-}
+})
 
-COLOR_SATURATION_MAP = {
+COLOR_SATURATION_MAP = MappingProxyType({
     "muted": 0.25,
     "moderate": 0.50,
     "vibrant": 0.80,
-}
+})
 
-PATTERN_CONTRAST_MAP = {
+PATTERN_CONTRAST_MAP = MappingProxyType({
     "low": 0.20,
     "medium": 0.50,
     "high": 0.80,
-}
+})
 
-GSM_MAP = {
+GSM_MAP = MappingProxyType({
     "very_light": 80,
     "light": 120,
     "medium": 180,
     "heavy": 280,
-}
+})
 
-DRAPE_MAP = {
+DRAPE_MAP = MappingProxyType({
     "stiff": 2.0,
     "structured": 4.0,
     "fluid": 7.0,
     "very_drapey": 9.0,
-}
+})
 
-FIT_EXPANSION_MAP = {
+FIT_EXPANSION_MAP = MappingProxyType({
     "tight": 0.00,
     "fitted": 0.02,
     "semi_fitted": 0.05,
     "relaxed": 0.10,
     "loose": 0.18,
     "oversized": 0.25,
-}
+})
 
-FIT_EASE_MAP = {
+FIT_EASE_MAP = MappingProxyType({
     "tight": 0.0,
     "fitted": 1.0,
     "semi_fitted": 2.5,
     "relaxed": 4.0,
     "loose": 6.0,
     "oversized": 8.0,
-}
+})
 
-HEM_POSITION_MAP = {
+HEM_POSITION_MAP = MappingProxyType({
     "mini": "mini",
     "above_knee": "above_knee",
     "at_knee": "knee",
@@ -187,18 +191,18 @@ HEM_POSITION_MAP = {
     "maxi": "ankle",
     "floor_length": "floor",
     "high_low": "knee",
-}
+})
 
-WAIST_POSITION_MAP = {
+WAIST_POSITION_MAP = MappingProxyType({
     "empire": "empire",
     "natural": "natural",
     "drop": "drop",
     "low": "drop",
     "undefined": "no_waist",
     "elasticized": "natural",
-}
+})
 
-FIBER_CONSTRUCTION_MAP = {
+FIBER_CONSTRUCTION_MAP = MappingProxyType({
     "cotton": FabricConstruction.WOVEN,
     "linen": FabricConstruction.WOVEN,
     "silk": FabricConstruction.WOVEN,
@@ -217,27 +221,27 @@ FIBER_CONSTRUCTION_MAP = {
     "crepe": FabricConstruction.WOVEN,
     "tweed": FabricConstruction.WOVEN,
     "velvet": FabricConstruction.WOVEN,
-}
+})
 
 # Fabric body interaction → expansion_rate adjustment
-BODY_INTERACTION_MAP = {
+BODY_INTERACTION_MAP = MappingProxyType({
     "clinging": -0.03,       # reduce expansion (fabric clings to body)
     "skimming": 0.0,         # neutral
     "standing_away": 0.05,   # fabric stands away → more expansion
     "draping_away": 0.03,    # drapes loosely
-}
+})
 
 # Model apparent size → US numeric size estimate
-MODEL_APPARENT_SIZE_MAP = {
+MODEL_APPARENT_SIZE_MAP = MappingProxyType({
     "xs": 0,
     "s": 4,
     "m": 8,
     "l": 12,
     "xl": 16,
     "xxl": 18,
-}
+})
 
-GOAL_MAP = {
+GOAL_MAP = MappingProxyType({
     "look_taller": StylingGoal.LOOK_TALLER,
     "highlight_waist": StylingGoal.HIGHLIGHT_WAIST,
     "hide_midsection": StylingGoal.HIDE_MIDSECTION,
@@ -254,7 +258,7 @@ GOAL_MAP = {
     "create_curves": StylingGoal.EMPHASIS,
     "minimize_bust": StylingGoal.CONCEALMENT,
     "show_legs": StylingGoal.EMPHASIS,
-}
+})
 
 # ================================================================
 # FABRIC GSM RESOLUTION (5-priority chain)
@@ -267,13 +271,96 @@ _RESOLUTION_TABLE_PATH = os.path.join(
 _RESOLUTION_TABLE: Optional[dict] = None
 
 
+def _prepare_resolution_table(table: dict) -> dict:
+    """Precompute lookup structures that don't change after load.
+
+    - Drops ``_doc`` entries from the lookup sections.
+    - ``_sorted_keywords``: keyword matches, longest first.
+    - ``_search_pattern`` / ``_search_prefixes``: single compiled regex
+      alternation over every keyword and disambiguation clue word (longest
+      first), plus the shorter words each one starts with.
+    - ``_fwd_by_weight``: fiber -> weight -> first ``(key, match_data)``
+      entry of that weight in ``fiber_weight_drape_resolution``.
+    - ``match_data["_proto"]``: FabricResolution prototype (gsm, fabric_id,
+      confidence with the caller's default applied) on every keyword,
+      disambiguation and fiber/weight/drape entry.
+    """
+    for section in ("text_keyword_matches", "fiber_disambiguation",
+                    "fiber_weight_drape_resolution", "fallback_by_weight_only"):
+        if section in table:
+            table[section].pop("_doc", None)
+
+    # Check multi-word keywords first (longest match wins)
+    table["_sorted_keywords"] = sorted(
+        table.get("text_keyword_matches", {}).items(),
+        key=lambda x: len(x[0]),
+        reverse=True,
+    )
+
+    search_words = set(table.get("text_keyword_matches", {}))
+    search_words.update(table.get("fiber_disambiguation", {}))
+
+    # The lookahead reports the longest word starting at each position;
+    # shorter words sharing that start are recovered via _search_prefixes.
+    by_length = sorted(search_words, key=len, reverse=True)
+    table["_search_pattern"] = re.compile(
+        "(?=(" + "|".join(re.escape(w) for w in by_length) + "))"
+    ) if by_length else None
+    table["_search_prefixes"] = {
+        word: tuple(w for w in by_length if w != word and word.startswith(w))
+        for word in by_length
+    }
+
+    for match_data in table.get("text_keyword_matches", {}).values():
+        _attach_proto(match_data, "moderate")
+    for sections in (table.get("fiber_disambiguation", {}),
+                     table.get("fiber_weight_drape_resolution", {})):
+        for entries in sections.values():
+            for key, match_data in entries.items():
+                _attach_proto(match_data, "low" if key == "default" else "moderate")
+
+    fwd_by_weight = {}
+    for fiber, fiber_entries in table.get("fiber_weight_drape_resolution", {}).items():
+        by_weight = fwd_by_weight[fiber] = {}
+        for key, match_data in fiber_entries.items():
+            weight, sep, _drape = key.partition("|")
+            if sep:
+                by_weight.setdefault(weight, (key, match_data))
+    table["_fwd_by_weight"] = fwd_by_weight
+    return table
+
+
+def _attach_proto(match_data: dict, default_confidence: str) -> None:
+    """Store the FabricResolution fields of a table entry as ``_proto``."""
+    match_data["_proto"] = FabricResolution(
+        gsm=match_data["gsm"],
+        fabric_id=match_data.get("fabric_id"),
+        confidence=match_data.get("confidence", default_confidence),
+    )
+
+
+def _find_text_hits(table: dict, text: str) -> set:
+    """Return the keywords / clue words from the table that occur in text."""
+    pattern = table.get("_search_pattern")
+    if pattern is None:
+        return set()
+    prefixes = table["_search_prefixes"]
+    hits = set()
+    for match in pattern.finditer(text):
+        word = match.group(1)
+        if word not in hits:
+            hits.add(word)
+            hits.update(prefixes[word])
+    return hits
+
+
 def _get_resolution_table() -> dict:
     """Lazy-load the fabric GSM resolution table."""
     global _RESOLUTION_TABLE
     if _RESOLUTION_TABLE is None:
         if os.path.exists(_RESOLUTION_TABLE_PATH):
             with open(_RESOLUTION_TABLE_PATH, "r") as f:
-                _RESOLUTION_TABLE = json.load(f)
+                _RESOLUTION_TABLE = _prepare_resolution_table(json.load(f))
         else:
             logger.warning("Fabric GSM resolution table not found at %s", _RESOLUTION_TABLE_PATH)
             _RESOLUTION_TABLE = {}
@@ -293,10 +380,47 @@ FIBER_NORMALIZE = {
     "acrylic": "polyester",
 }
 
+# Partial-match index over FIBER_NORMALIZE. The lookahead alternation
+# reports the longest key starting at each position; each key's rank is
+# the earliest dict position among it and the shorter keys it starts with.
+_FIBER_NORMALIZE_VALUES = tuple(FIBER_NORMALIZE.values())
+_FIBER_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(FIBER_NORMALIZE, key=len, reverse=True))
+    + "))"
+)
+_FIBER_MATCH_RANK = {
+    key: min(i for i, k in enumerate(FIBER_NORMALIZE) if key.startswith(k))
+    for key in FIBER_NORMALIZE
+}
+
+
+# Conditional keyword GSM overrides from the table notes:
+# keyword -> fn(gsm, primary_fiber, price, stretch_pct, searchable_text),
+# returning the adjusted GSM, or None to skip the keyword.
+_KEYWORD_GSM_OVERRIDES = {
+    "chiffon": lambda gsm, fiber, price, stretch_pct, text: (
+        40 if fiber == "silk" and price and price > 80 else gsm),
+    "charmeuse": lambda gsm, fiber, price, stretch_pct, text: (
+        130 if price and price < 50 else gsm),
+    "denim": lambda gsm, fiber, price, stretch_pct, text: (
+        320 if stretch_pct > 0 else gsm),
+    "velvet": lambda gsm, fiber, price, stretch_pct, text: (
+        250 if "crushed" in text else gsm),
+    "satin": lambda gsm, fiber, price, stretch_pct, text: (
+        90 if fiber == "silk" and price and price > 80 else gsm),
+    # Skip — will match "faux leather" keyword instead
+    "leather": lambda gsm, fiber, price, stretch_pct, text: (
+        None if "faux" in text or "vegan" in text else gsm),
+    # power mesh is heavier
+    "mesh": lambda gsm, fiber, price, stretch_pct, text: (
+        200 if "power" in text else gsm),
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FabricResolution:
-    """Result of fabric GSM resolution."""
+    """Result of fabric GSM resolution (immutable; results are cached)."""
     gsm: float
     fabric_id: Optional[str] = None
     confidence: str = "low"
@@ -307,22 +431,31 @@ def _normalize_fiber(fiber_name: Optional[str]) -> str:
     """Normalize a fiber name to a standard key."""
     if not fiber_name:
         return "polyester"
-    normalized = FIBER_NORMALIZE.get(fiber_name.lower().strip())
+    lower = fiber_name.lower().strip()
+    normalized = FIBER_NORMALIZE.get(lower)
     if normalized:
         return normalized
-    # Try partial match
-    lower = fiber_name.lower().strip()
-    for key, val in FIBER_NORMALIZE.items():
-        if key in lower:
-            return val
+    # Try partial match: the first FIBER_NORMALIZE key (in dict order)
+    # contained in the name wins
+    best = None
+    for match in _FIBER_RE.finditer(lower):
+        rank = _FIBER_MATCH_RANK[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+    if best is not None:
+        return _FIBER_NORMALIZE_VALUES[best]
     return lower
 
 
+_PRICE_RE = re.compile(r'[\d,.]+')
+
+
+@functools.lru_cache(maxsize=1024)
 def _parse_price(price_str: Optional[str]) -> Optional[float]:
     """Extract numeric price from a price string."""
     if not price_str:
         return None
-    match = re.search(r'[\d,.]+', price_str)
+    match = _PRICE_RE.search(price_str)
     if match:
         try:
             return float(match.group().replace(',', ''))
@@ -331,7 +464,19 @@ def _parse_price(price_str: Optional[str]) -> Optional[float]:
     return None
 
 
-def resolve_fabric_gsm(garment_attrs: dict) -> FabricResolution:
+def _lowered_text(garment_attrs: dict) -> Tuple[str, str, str]:
+    """Lowercased (title, fabric_composition, care_instructions), '' if missing."""
+    return (
+        (garment_attrs.get("title") or "").lower(),
+        (garment_attrs.get("fabric_composition") or "").lower(),
+        (garment_attrs.get("care_instructions") or "").lower(),
+    )
+
+
+def resolve_fabric_gsm(
+    garment_attrs: dict,
+    lowered_text: Optional[Tuple[str, str, str]] = None,
+) -> FabricResolution:
     """Resolve fabric GSM using 5-priority chain.
 
     Priority 1: Text keyword matches (product title, fabric_composition, care text)
@@ -342,115 +487,123 @@ def resolve_fabric_gsm(garment_attrs: dict) -> FabricResolution:
 
     Args:
         garment_attrs: Merged garment attribute dict from pipeline.
+        lowered_text: Optional precomputed ``_lowered_text(garment_attrs)``,
+            for callers that also need the lowercased text.
 
     Returns:
         FabricResolution with gsm, fabric_id, confidence, and resolution_path.
+        Results are cached on the consulted fields and shared between calls.
+    """
+    if lowered_text is None:
+        lowered_text = _lowered_text(garment_attrs)
+    return _resolve_fabric_gsm_cached(
+        *lowered_text,
+        garment_attrs.get("fabric_primary"),
+        garment_attrs.get("fabric_secondary"),
+        garment_attrs.get("fabric_weight"),
+        garment_attrs.get("fabric_drape"),
+        garment_attrs.get("stretch_percentage", 0),
+        garment_attrs.get("price"),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_fabric_gsm_cached(
+    title: str,
+    composition: str,
+    care: str,
+    fabric_primary: Optional[str],
+    fabric_secondary: Optional[str],
+    weight: Optional[str],
+    drape: Optional[str],
+    stretch_pct,
+    price_str: Optional[str],
+) -> FabricResolution:
+    """resolve_fabric_gsm body, memoized on the garment fields it reads.
+
+    Text fields arrive already lowercased (see _lowered_text).
     """
     table = _get_resolution_table()
     if not table:
         # No table available, use old GSM_MAP fallback
-        weight = garment_attrs.get("fabric_weight")
         return FabricResolution(
             gsm=GSM_MAP.get(weight, 180) if weight else 180,
             confidence="very_low",
             resolution_path="no_table_fallback",
         )
 
-    # Gather all text signals
-    title = (garment_attrs.get("title") or "").lower()
-    composition = (garment_attrs.get("fabric_composition") or "").lower()
-    care = (garment_attrs.get("care_instructions") or "").lower()
-    searchable_text = f"{title} {composition} {care}"
+    # Gather all text signals (minimal catalog rows often have none)
+    searchable_text = f"{title} {composition} {care}" if title or composition or care else ""
 
-    primary_fiber = _normalize_fiber(garment_attrs.get("fabric_primary"))
-    secondary_fiber = _normalize_fiber(garment_attrs.get("fabric_secondary"))
-    weight = garment_attrs.get("fabric_weight")  # very_light|light|medium|heavy
-    drape = garment_attrs.get("fabric_drape")    # stiff|structured|fluid|very_drapey
-    stretch_pct = garment_attrs.get("stretch_percentage", 0) or 0
-    price = _parse_price(garment_attrs.get("price"))
+    primary_fiber = _normalize_fiber(fabric_primary)
+    secondary_fiber = _normalize_fiber(fabric_secondary)
+    # weight: very_light|light|medium|heavy
+    # drape:  stiff|structured|fluid|very_drapey
+    stretch_pct = stretch_pct or 0
+    price = _parse_price(price_str)
 
     # -------------------------------------------------------------------
     # Priority 1: Text keyword matches
     # -------------------------------------------------------------------
-    keyword_matches = table.get("text_keyword_matches", {})
+    text_hits = _find_text_hits(table, searchable_text) if searchable_text else set()
+
+    # Multi-word keywords are checked first (longest match wins)
+    if text_hits:
+        for keyword, match_data in table["_sorted_keywords"]:
+            if keyword in text_hits:
+                proto = match_data["_proto"]
+                gsm = proto.gsm
+
+                # Apply conditional overrides from notes
+                override = _KEYWORD_GSM_OVERRIDES.get(keyword)
+                if override is not None:
+                    gsm = override(gsm, primary_fiber, price, stretch_pct, searchable_text)
+                    if gsm is None:
+                        continue
 
-    # Check multi-word keywords first (longest match wins)
-    sorted_keywords = sorted(
-        [(k, v) for k, v in keyword_matches.items() if k != "_doc"],
-        key=lambda x: len(x[0]),
-        reverse=True,
-    )
-
-    for keyword, match_data in sorted_keywords:
-        if keyword in searchable_text:
-            gsm = match_data["gsm"]
-
-            # Apply conditional overrides from notes
-            if keyword == "chiffon" and primary_fiber == "silk" and price and price > 80:
-                gsm = 40
-            elif keyword == "charmeuse" and price and price < 50:
-                gsm = 130
-            elif keyword == "denim" and stretch_pct > 0:
-                gsm = 320
-            elif keyword == "velvet" and "crushed" in searchable_text:
-                gsm = 250
-            elif keyword == "satin" and primary_fiber == "silk" and price and price > 80:
-                gsm = 90
-            elif keyword == "leather" and ("faux" in searchable_text or "vegan" in searchable_text):
-                continue  # Skip — will match "faux leather" keyword instead
-            elif keyword == "mesh" and "power" in searchable_text:
-                gsm = 200  # power mesh is heavier
-
-            return FabricResolution(
-                gsm=gsm,
-                fabric_id=match_data.get("fabric_id"),
-                confidence=match_data.get("confidence", "moderate"),
-                resolution_path=f"keyword:{keyword}",
-            )
+                return FabricResolution(
+                    gsm=gsm,
+                    fabric_id=proto.fabric_id,
+                    confidence=proto.confidence,
+                    resolution_path=f"keyword:{keyword}",
+                )
 
     # -------------------------------------------------------------------
     # Priority 2: Fiber + construction clue disambiguation
     # -------------------------------------------------------------------
     fiber_disambig = table.get("fiber_disambiguation", {})
-    for clue_word, fiber_map in fiber_disambig.items():
-        if clue_word == "_doc":
-            continue
-        if clue_word in searchable_text:
-            # Check primary fiber, then secondary, then default
-            for fiber in [primary_fiber, secondary_fiber]:
-                if fiber and fiber in fiber_map:
-                    match_data = fiber_map[fiber]
+    # Most titles carry no clue word; skip the loop without walking it
+    if not text_hits.isdisjoint(fiber_disambig):
+        for clue_word, fiber_map in fiber_disambig.items():
+            if clue_word in text_hits:
+                # Check primary fiber, then secondary, then default
+                for fiber in [primary_fiber, secondary_fiber]:
+                    if fiber and fiber in fiber_map:
+                        proto = fiber_map[fiber]["_proto"]
+                        return FabricResolution(
+                            gsm=proto.gsm,
+                            fabric_id=proto.fabric_id,
+                            confidence=proto.confidence,
+                            resolution_path=f"disambig:{clue_word}+{fiber}",
+                        )
+                # Use default if no fiber match
+                if "default" in fiber_map:
+                    proto = fiber_map["default"]["_proto"]
                     return FabricResolution(
-                        gsm=match_data["gsm"],
-                        fabric_id=match_data.get("fabric_id"),
-                        confidence=match_data.get("confidence", "moderate"),
-                        resolution_path=f"disambig:{clue_word}+{fiber}",
+                        gsm=proto.gsm,
+                        fabric_id=proto.fabric_id,
+                        confidence=proto.confidence,
+                        resolution_path=f"disambig:{clue_word}+default",
                     )
-            # Use default if no fiber match
-            if "default" in fiber_map:
-                match_data = fiber_map["default"]
-                return FabricResolution(
-                    gsm=match_data["gsm"],
-                    fabric_id=match_data.get("fabric_id"),
-                    confidence=match_data.get("confidence", "low"),
-                    resolution_path=f"disambig:{clue_word}+default",
-                )
 
     # -------------------------------------------------------------------
     # Priority 3: Fiber + weight + drape
     # -------------------------------------------------------------------
     fwd_table = table.get("fiber_weight_drape_resolution", {})
+    fwd_by_weight = table["_fwd_by_weight"]
 
-    # Normalize drape for lookup key
+    # Drape values are already the table's lookup keys
     drape_key = drape
-    if drape_key == "stiff":
-        drape_key = "stiff"
-    elif drape_key == "structured":
-        drape_key = "structured"
-    elif drape_key == "fluid":
-        drape_key = "fluid"
-    elif drape_key == "very_drapey":
-        drape_key = "very_drapey"
 
     for fiber in [primary_fiber, secondary_fiber]:
         if not fiber or fiber not in fwd_table:
@@ -461,45 +614,50 @@ def resolve_fabric_gsm(garment_attrs: dict) -> FabricResolution:
         if weight and drape_key:
             lookup_key = f"{weight}|{drape_key}"
             if lookup_key in fiber_entries:
-                match_data = fiber_entries[lookup_key]
+                proto = fiber_entries[lookup_key]["_proto"]
                 return FabricResolution(
-                    gsm=match_data["gsm"],
-                    fabric_id=match_data.get("fabric_id"),
-                    confidence=match_data.get("confidence", "moderate"),
+                    gsm=proto.gsm,
+                    fabric_id=proto.fabric_id,
+                    confidence=proto.confidence,
                     resolution_path=f"fwd:{fiber}|{lookup_key}",
                 )
 
-        # Try weight|stiff and weight|structured as equivalent for structured fabrics
+        # Try weight|stiff and weight|structured as equivalent for structured
+        # fabrics (the exact key was already tried above, so only the other one)
         if weight and drape_key in ("stiff", "structured"):
-            for alt_drape in ("stiff", "structured"):
-                alt_key = f"{weight}|{alt_drape}"
-                if alt_key in fiber_entries:
-                    match_data = fiber_entries[alt_key]
-                    return FabricResolution(
-                        gsm=match_data["gsm"],
-                        fabric_id=match_data.get("fabric_id"),
-                        confidence=match_data.get("confidence", "low"),
-                        resolution_path=f"fwd:{fiber}|{alt_key}(alt)",
-                    )
+            alt_drape = "structured" if drape_key == "stiff" else "stiff"
+            alt_key = f"{weight}|{alt_drape}"
+            match_data = fiber_entries.get(alt_key)
+            if match_data is not None:
+                proto = match_data["_proto"]
+                return FabricResolution(
+                    gsm=proto.gsm,
+                    fabric_id=proto.fabric_id,
+                    # alternates default to low confidence, not the prototype's
+                    confidence=match_data.get("confidence", "low"),
+                    resolution_path=f"fwd:{fiber}|{alt_key}(alt)",
+                )
 
         # Try weight only (any drape)
         if weight:
-            for key, match_data in fiber_entries.items():
-                if key.startswith(f"{weight}|"):
-                    return FabricResolution(
-                        gsm=match_data["gsm"],
-                        fabric_id=match_data.get("fabric_id"),
-                        confidence="low",
-                        resolution_path=f"fwd:{fiber}|{key}(partial)",
-                    )
+            partial = fwd_by_weight[fiber].get(weight)
+            if partial is not None:
+                key, match_data = partial
+                proto = match_data["_proto"]
+                return FabricResolution(
+                    gsm=proto.gsm,
+                    fabric_id=proto.fabric_id,
+                    confidence="low",
+                    resolution_path=f"fwd:{fiber}|{key}(partial)",
+                )
 
         # Fiber default
         if "default" in fiber_entries:
-            match_data = fiber_entries["default"]
+            proto = fiber_entries["default"]["_proto"]
             return FabricResolution(
-                gsm=match_data["gsm"],
-                fabric_id=match_data.get("fabric_id"),
-                confidence=match_data.get("confidence", "low"),
+                gsm=proto.gsm,
+                fabric_id=proto.fabric_id,
+                confidence=proto.confidence,
                 resolution_path=f"fwd:{fiber}|default",
             )
 
@@ -524,18 +682,26 @@ def resolve_fabric_gsm(garment_attrs: dict) -> FabricResolution:
 
 
 # Known fast-fashion brands
-_FAST_FASHION_BRANDS = {
+_FAST_FASHION_BRANDS = frozenset({
     "h&m", "zara", "shein", "forever 21", "primark", "boohoo",
     "fashion nova", "romwe", "asos",
-}
-_LUXURY_BRANDS = {
+})
+_LUXURY_BRANDS = frozenset({
     "gucci", "prada", "chanel", "louis vuitton", "dior", "versace",
     "balenciaga", "valentino", "saint laurent", "burberry",
-}
-_PREMIUM_BRANDS = {
+})
+_PREMIUM_BRANDS = frozenset({
     "coach", "michael kors", "kate spade", "tory burch", "ted baker",
     "reiss", "sandro", "maje", "allsaints",
-}
+})
+
+# Single brand -> tier lookup (merged so that fast fashion, then luxury,
+# then premium takes precedence, as the sets were checked in that order)
+_BRAND_TO_TIER = MappingProxyType(
+    {b: BrandTier.PREMIUM for b in _PREMIUM_BRANDS}
+    | {b: BrandTier.LUXURY for b in _LUXURY_BRANDS}
+    | {b: BrandTier.FAST_FASHION for b in _FAST_FASHION_BRANDS}
+)
 
 
 # ================================================================
@@ -548,61 +714,82 @@ def _safe_get(d: dict, key: str, default=None):
     return val if val is not None else default
 
 
-def _map_enum(value, mapping: dict, default, label: str = ""):
+def _map_enum(key: str, value, mapping, default):
     """Map a string value to an enum using a lookup table. Log warning if unknown."""
     if value is None:
         return default
     result = mapping.get(value)
     if result is None:
-        logger.warning("Unknown %s value: %r, using default %r", label, value, default)
+        logger.warning("Unknown %s value: %r, using default %r", key, value, default)
         return default
     return result
 
 
+# (attribute key, mapping table, default) for the enum-valued attributes
+# decoded by build_garment_profile, in the order it unpacks them.
+_ENUM_COLUMNS = (
+    ("garment_type", CATEGORY_MAP, GarmentCategory.DRESS),
+    ("silhouette_type", SILHOUETTE_MAP, Silhouette.SEMI_FITTED),
+    ("neckline_type", NECKLINE_MAP, NecklineType.CREW),
+    ("sleeve_type", SLEEVE_MAP, SleeveType.SET_IN),
+    ("fabric_sheen", SHEEN_MAP, SurfaceFinish.MATTE),
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def estimate_brand_tier(price_str: Optional[str], brand: Optional[str]) -> BrandTier:
     """Estimate brand tier from price string and brand name."""
     # Check brand name first
     if brand:
-        brand_lower = brand.lower().strip()
-        if brand_lower in _FAST_FASHION_BRANDS:
-            return BrandTier.FAST_FASHION
-        if brand_lower in _LUXURY_BRANDS:
-            return BrandTier.LUXURY
-        if brand_lower in _PREMIUM_BRANDS:
-            return BrandTier.PREMIUM
+        tier = _BRAND_TO_TIER.get(brand.lower().strip())
+        if tier is not None:
+            return tier
 
     # Try to parse price
-    if price_str:
-        match = re.search(r'[\d,.]+', price_str)
-        if match:
-            try:
-                price = float(match.group().replace(',', ''))
-                if price < 30:
-                    return BrandTier.FAST_FASHION
-                if price < 80:
-                    return BrandTier.MASS_MARKET
-                if price < 200:
-                    return BrandTier.MID_MARKET
-                if price < 500:
-                    return BrandTier.PREMIUM
-                return BrandTier.LUXURY
-            except ValueError:
-                pass
+    price = _parse_price(price_str)
+    if price is not None:
+        if price < 30:
+            return BrandTier.FAST_FASHION
+        if price < 80:
+            return BrandTier.MASS_MARKET
+        if price < 200:
+            return BrandTier.MID_MARKET
+        if price < 500:
+            return BrandTier.PREMIUM
+        return BrandTier.LUXURY
 
     return BrandTier.MID_MARKET
 
 
+_MODEL_SIZE_MAP = MappingProxyType({
+    "XXS": 0, "XS": 0, "S": 4, "M": 8, "L": 12,
+    "XL": 16, "XXL": 18, "XXXL": 20,
+})
+
+_FULL_BODY_CATEGORIES = frozenset({
+    GarmentCategory.DRESS, GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
+})
+_LOWER_BODY_CATEGORIES = frozenset({
+    GarmentCategory.BOTTOM_PANTS, GarmentCategory.BOTTOM_SHORTS,
+    GarmentCategory.SKIRT,
+})
+
+_NECKLINE_DEPTH_CM = MappingProxyType({
+    "shallow": 3.0, "medium": 8.0, "deep": 14.0, "plunging": 20.0,
+})
+_SLEEVE_EASE_MAP = MappingProxyType({
+    "fitted": 0.5, "semi_fitted": 1.0, "relaxed": 2.0, "voluminous": 4.0,
+})
+
+
+@functools.lru_cache(maxsize=1024)
 def _estimate_model_size(size_str: Optional[str]) -> int:
     """Convert model size string to US numeric size."""
     if not size_str:
         return 2
     s = size_str.strip().upper()
-    size_map = {
-        "XXS": 0, "XS": 0, "S": 4, "M": 8, "L": 12,
-        "XL": 16, "XXL": 18, "XXXL": 20,
-    }
-    if s in size_map:
-        return size_map[s]
+    if s in _MODEL_SIZE_MAP:
+        return _MODEL_SIZE_MAP[s]
     try:
         return int(s)
     except ValueError:
@@ -611,16 +798,9 @@ def _estimate_model_size(size_str: Optional[str]) -> int:
 
 def _detect_zone(category: GarmentCategory) -> str:
     """Determine which body zone a garment category covers."""
-    full_body = {
-        GarmentCategory.DRESS, GarmentCategory.JUMPSUIT, GarmentCategory.ROMPER,
-    }
-    lower_body = {
-        GarmentCategory.BOTTOM_PANTS, GarmentCategory.BOTTOM_SHORTS,
-        GarmentCategory.SKIRT,
-    }
-    if category in full_body:
+    if category in _FULL_BODY_CATEGORIES:
         return "full_body"
-    if category in lower_body:
+    if category in _LOWER_BODY_CATEGORIES:
         return "lower_body"
     return "torso"
 
@@ -641,6 +821,22 @@ def _detect_covers(category: GarmentCategory, hem_position: str):
 # BODY PROFILE BUILDER
 # ================================================================
 
+# Raw body-scan measurements in CM, with defaults, in the order
+# build_body_profile unpacks them
+_CM_MEASUREMENTS: Tuple[Tuple[str, float], ...] = (
+    ("height", 167.64),
+    ("chest_circumference", 91.44),
+    ("waist_circumference", 76.2),
+    ("hip_circumference", 96.52),
+    ("shoulder_breadth", 39.37),
+    ("neck_circumference", 33.02),
+    ("arm_right_length", 58.42),
+    ("inside_leg_height", 76.2),
+    ("thigh_left_circumference", 55.88),
+    ("ankle_left_circumference", 21.59),
+)
+
+
 def build_body_profile(
     user_measurements: dict,
     styling_goals: Optional[List[str]] = None,
@@ -658,16 +854,11 @@ def build_body_profile(
     u = user_measurements
 
     # --- Core measurements (cm -> inches) ---
-    height = _safe_get(u, "height", 167.64) * CM_TO_IN
-    bust = _safe_get(u, "chest_circumference", 91.44) * CM_TO_IN
-    waist = _safe_get(u, "waist_circumference", 76.2) * CM_TO_IN
-    hip = _safe_get(u, "hip_circumference", 96.52) * CM_TO_IN
-    shoulder_width = _safe_get(u, "shoulder_breadth", 39.37) * CM_TO_IN
-    neck_circumference = _safe_get(u, "neck_circumference", 33.02) * CM_TO_IN
-    arm_length = _safe_get(u, "arm_right_length", 58.42) * CM_TO_IN
-    inseam = _safe_get(u, "inside_leg_height", 76.2) * CM_TO_IN
-    c_thigh_max = _safe_get(u, "thigh_left_circumference", 55.88) * CM_TO_IN
-    c_ankle = _safe_get(u, "ankle_left_circumference", 21.59) * CM_TO_IN
+    (height, bust, waist, hip, shoulder_width, neck_circumference,
+     arm_length, inseam, c_thigh_max, c_ankle) = [
+        (value if (value := u.get(key)) is not None else default) * CM_TO_IN
+        for key, default in _CM_MEASUREMENTS
+    ]
 
     # --- Derived landmarks (already in inches from calc_derived) ---
     h_knee = _safe_get(u, "knee_from_floor", 18.0)
@@ -736,71 +927,37 @@ def build_garment_profile(garment_attrs: dict) -> GarmentProfile:
     """
     g = garment_attrs
 
-    # --- Category ---
-    category = _map_enum(
-        _safe_get(g, "garment_type"),
-        CATEGORY_MAP,
-        GarmentCategory.DRESS,
-        "garment_type",
-    )
-
-    # --- Silhouette ---
-    silhouette = _map_enum(
-        _safe_get(g, "silhouette_type"),
-        SILHOUETTE_MAP,
-        Silhouette.SEMI_FITTED,
-        "silhouette_type",
-    )
-
-    # --- Neckline ---
-    neckline = _map_enum(
-        _safe_get(g, "neckline_type"),
-        NECKLINE_MAP,
-        NecklineType.CREW,
-        "neckline_type",
-    )
+    # --- Category / silhouette / neckline / sleeve / sheen enums ---
+    category, silhouette, neckline, sleeve_type, surface = [
+        _map_enum(key, g.get(key), mapping, default)
+        for key, mapping, default in _ENUM_COLUMNS
+    ]
 
     # V-depth estimation from neckline_depth string
     v_depth_cm = 0.0
     neckline_depth_str = _safe_get(g, "neckline_depth")
     if neckline_depth_str:
-        depth_map = {"shallow": 3.0, "medium": 8.0, "deep": 14.0, "plunging": 20.0}
-        v_depth_cm = depth_map.get(neckline_depth_str, 0.0)
-
-    # --- Sleeve ---
-    sleeve_type = _map_enum(
-        _safe_get(g, "sleeve_type"),
-        SLEEVE_MAP,
-        SleeveType.SET_IN,
-        "sleeve_type",
-    )
+        v_depth_cm = _NECKLINE_DEPTH_CM.get(neckline_depth_str, 0.0)
 
     # Sleeve ease from sleeve_width
     sleeve_width = _safe_get(g, "sleeve_width")
-    sleeve_ease_map = {
-        "fitted": 0.5, "semi_fitted": 1.0, "relaxed": 2.0, "voluminous": 4.0,
-    }
-    sleeve_ease_inches = sleeve_ease_map.get(sleeve_width, 1.0) if sleeve_width else 1.0
-
-    # --- Surface / Sheen ---
-    surface = _map_enum(
-        _safe_get(g, "fabric_sheen"),
-        SHEEN_MAP,
-        SurfaceFinish.MATTE,
-        "fabric_sheen",
-    )
+    sleeve_ease_inches = _SLEEVE_EASE_MAP.get(sleeve_width, 1.0) if sleeve_width else 1.0
 
     # --- Fabric properties ---
-    primary_fiber = (_safe_get(g, "fabric_primary") or "polyester").lower()
-    primary_fiber = _normalize_fiber(primary_fiber)
+    # _normalize_fiber lowercases the names itself
+    primary_fiber = _normalize_fiber(_safe_get(g, "fabric_primary") or "polyester")
     secondary_fiber = _safe_get(g, "fabric_secondary")
     if secondary_fiber:
-        secondary_fiber = _normalize_fiber(secondary_fiber.lower())
+        secondary_fiber = _normalize_fiber(secondary_fiber)
 
     fabric_weight = _safe_get(g, "fabric_weight")
 
+    # Title / composition / care, lowercased once for GSM resolution and
+    # lining detection
+    lowered_text = _lowered_text(g)
+
     # Resolve GSM using 5-priority chain (replaces old GSM_MAP)
-    fabric_resolution = resolve_fabric_gsm(g)
+    fabric_resolution = resolve_fabric_gsm(g, lowered_text)
     gsm_estimated = fabric_resolution.gsm
     logger.debug(
         "Fabric GSM resolved: %d gsm via %s (confidence=%s, fabric_id=%s)",
@@ -868,8 +1025,7 @@ def build_garment_profile(garment_attrs: dict) -> GarmentProfile:
     has_darts = _safe_get(g, "has_darts") is True
 
     # Lining detection from fabric_composition
-    fabric_composition = _safe_get(g, "fabric_composition", "")
-    has_lining = "lining" in fabric_composition.lower() if fabric_composition else False
+    has_lining = "lining" in lowered_text[1]
 
     # --- Brand tier ---
     brand_tier = estimate_brand_tier(
@@ -884,8 +1040,9 @@ def build_garment_profile(garment_attrs: dict) -> GarmentProfile:
         model_estimated_size = _estimate_model_size(model_size_worn)
     else:
         apparent_size = _safe_get(g, "model_apparent_size_category")
-        if apparent_size and apparent_size.lower() in MODEL_APPARENT_SIZE_MAP:
-            model_estimated_size = MODEL_APPARENT_SIZE_MAP[apparent_size.lower()]
+        apparent_size = apparent_size.lower() if apparent_size else None
+        if apparent_size in MODEL_APPARENT_SIZE_MAP:
+            model_estimated_size = MODEL_APPARENT_SIZE_MAP[apparent_size]
         else:
             model_estimated_size = _estimate_model_size(None)
 
@@ -1,7 +1,8 @@
 """
 Kridha Communication Engine — End-to-End Pipeline
 ===================================================
-Takes ScoreResult + profiles → returns UI-ready CommunicationOutput JSON.
+Takes ScoreResult + profiles → returns the UI-ready response dict
+(the CommunicationOutput fields, ready for JSON).
 
 Zero LLM calls. Zero latency. Zero hallucination risk.
 Uses the phrase bank (gold_generator) for headlines + pinch,
@@ -19,16 +20,17 @@ Usage:
 """
 
 import hashlib
+from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from .communication_schema import (
-    CommunicationOutput,
+    PinchSegment,
     select_verdict,
     build_goal_chips,
     build_search_pills,
     build_search_context,
     build_chat_chips,
-    build_user_line,
+    build_user_line_fields,
     build_photo_note,
     build_confidence_note,
     build_triple_checks,
@@ -41,7 +43,7 @@ from .guardrails import check_output
 def _body_shape_str(body_profile: dict) -> str:
     """Extract body shape as a lowercase string."""
     shape = body_profile.get("body_shape", "rectangle")
-    if hasattr(shape, "value"):
+    if isinstance(shape, Enum):
         shape = shape.value
     return str(shape).lower()
 
@@ -49,7 +51,7 @@ def _body_shape_str(body_profile: dict) -> str:
 def _garment_category_str(garment_profile: dict) -> str:
     """Extract garment category as a lowercase string."""
     cat = garment_profile.get("category", "dress")
-    if hasattr(cat, "value"):
+    if isinstance(cat, Enum):
         cat = cat.value
     return str(cat).lower()
 
@@ -89,7 +91,8 @@ def generate_communication(
         run_guardrails:  Whether to validate output through guardrails
 
     Returns:
-        Dict with all CommunicationOutput fields + guardrail_result
+        Dict with the non-None CommunicationOutput fields, overall_score
+        and (if run_guardrails) guardrail_result
     """
     overall_score = score_result.get("overall_score", 5.0)
     body_shape = _body_shape_str(body_profile)
@@ -130,9 +133,12 @@ def generate_communication(
     chat_chips = build_chat_chips(verdict, garment_cat)
 
     # ── Step 7: User line ──
-    body_for_line = dict(body_profile)
-    body_for_line.setdefault("name", user_name)
-    user_line = build_user_line(body_for_line)
+    user_line = build_user_line_fields(
+        body_profile.get("name", user_name),
+        body_profile.get("height", 0),
+        body_profile.get("body_shape", ""),
+        body_profile.get("torso_leg_ratio", 0.50),
+    )
 
     # ── Step 8: Photo note ──
     body_adjusted = score_result.get("body_adjusted") or {}
@@ -153,23 +159,28 @@ def generate_communication(
     )
 
     # ── Assemble output ──
-    output = CommunicationOutput(
-        verdict=verdict,
-        verdict_color=color,
-        headline=headline,
-        pinch=[_seg_to_pinch(s) for s in pinch],
-        user_line=user_line,
-        goal_chips=goal_chips,
-        photo_note=photo_note,
-        confidence_note=confidence_note,
-        triple_checks=triple_checks,
-        search_pills=search_pills,
-        search_context=search_context,
-        chat_chips=chat_chips,
-        full_take_prompt_context=full_take_context,
-    )
-
-    result = output.to_dict()
+    # The response is serialized here, in CommunicationOutput field order,
+    # rather than through an intermediate dataclass
+    result = {
+        "verdict": verdict,
+        "verdict_color": color,
+        "headline": headline,
+        "pinch": [
+            s.to_dict() if isinstance(s, PinchSegment)
+            else {"text": s.get("text", ""), "style": s.get("style", "normal")}
+            for s in pinch
+        ],
+        "user_line": user_line,
+        "goal_chips": [chip.to_dict() for chip in goal_chips],
+        "photo_note": photo_note,
+        "confidence_note": confidence_note,
+        "triple_checks": triple_checks,
+        "search_pills": search_pills,
+        "search_context": search_context,
+        "chat_chips": chat_chips,
+        "full_take_prompt_context": full_take_context,
+    }
+    result = {k: v for k, v in result.items() if v is not None}
     result["overall_score"] = round(overall_score, 1)
 
     # ── Step 12: Guardrails ──
@@ -177,29 +188,13 @@ def generate_communication(
         gr = check_output(result)
         result["guardrail_result"] = {
             "passed": gr.passed,
-            "violations": [
-                {"rule": v.rule, "severity": v.severity,
-                 "text": v.text, "suggestion": v.suggestion}
-                for v in gr.violations
-            ],
-            "warnings": [
-                {"rule": w.rule, "severity": w.severity,
-                 "text": w.text, "suggestion": w.suggestion}
-                for w in gr.warnings
-            ],
+            "violations": [v.to_dict() for v in gr.violations],
+            "warnings": [w.to_dict() for w in gr.warnings],
         }
 
     return result
 
 
-def _seg_to_pinch(seg: dict):
-    """Convert a pinch segment dict to PinchSegment dataclass."""
-    from .communication_schema import PinchSegment
-    if isinstance(seg, dict):
-        return PinchSegment(text=seg.get("text", ""), style=seg.get("style", "normal"))
-    return seg
-
-
 def _build_full_take_context(
     verdict: str, overall_score: float, body_shape: str,
     garment_cat: str, analysis: dict, score_result: dict,
@@ -212,31 +207,20 @@ def _build_full_take_context(
     parts = [
         f"verdict={verdict} score={overall_score:.1f}",
         f"body={body_shape} garment={garment_cat}",
+        # Top 3 positives / negatives with reasoning
+        *[f"+{p.get('name', '')}({p.get('score', 0):+.2f}): {p.get('reasoning', '')}"
+          for p in analysis.get("positives", [])[:3]],
+        *[f"-{n.get('name', '')}({n.get('score', 0):+.2f}): {n.get('reasoning', '')}"
+          for n in analysis.get("negatives", [])[:3]],
     ]
 
-    # Top 3 positives with reasoning
-    for p in analysis.get("positives", [])[:3]:
-        name = p.get("name", "")
-        score = p.get("score", 0)
-        reasoning = p.get("reasoning", "")
-        parts.append(f"+{name}({score:+.2f}): {reasoning}")
-
-    # Top 3 negatives with reasoning
-    for n in analysis.get("negatives", [])[:3]:
-        name = n.get("name", "")
-        score = n.get("score", 0)
-        reasoning = n.get("reasoning", "")
-        parts.append(f"-{name}({score:+.2f}): {reasoning}")
-
     # Fixes
     fixes = score_result.get("fixes", [])
     if fixes:
-        fix_strs = []
-        for f in fixes[:3]:
-            if isinstance(f, dict):
-                fix_strs.append(f.get("what_to_change", ""))
-            else:
-                fix_strs.append(str(f))
-        parts.append(f"fixes=[{'; '.join(fix_strs)}]")
+        fix_strs = "; ".join(
+            f.get("what_to_change", "") if isinstance(f, dict) else str(f)
+            for f in fixes[:3]
+        )
+        parts.append(f"fixes=[{fix_strs}]")
 
     return " | ".join(parts)
@@ -9,7 +9,10 @@ Also contains deterministic components that don't need LLM:
   - chat chip suggestions
 """
 
-from dataclasses import dataclass, field, asdict
+import functools
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 
 
@@ -17,24 +20,34 @@ from typing import List, Dict, Optional, Tuple
 # OUTPUT DATACLASSES
 # ================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PinchSegment:
     """One styled segment of The Pinch text."""
     text: str
     style: str    # "normal" | "positive" | "negative" | "fix"
 
+    def to_dict(self) -> dict:
+        return {"text": self.text, "style": self.style}
+
 
-@dataclass
+@dataclass(slots=True)
 class GoalChip:
     """UI chip showing how a garment interacts with a user goal."""
     goal: str       # display label: "Look taller", "Streamline hips"
     icon: str
     verdict: str    # "helping" | "fighting" | "mixed"
 
+    def to_dict(self) -> dict:
+        return {"goal": self.goal, "icon": self.icon, "verdict": self.verdict}
+
 
-@dataclass
+@dataclass(slots=True)
 class CommunicationOutput:
-    """Complete UI-ready output from the communication engine."""
+    """Complete UI-ready output from the communication engine.
+
+    Documents the response fields; generate_communication() serializes
+    them straight into the response dict, in this order, dropping None.
+    """
     # Core verdict
     verdict: str                               # "this_is_it" | "smart_pick" | "not_this_one"
     verdict_color: str                         # "teal" | "amber" | "rose"
@@ -56,10 +69,6 @@ class CommunicationOutput:
     # Deferred LLM context
     full_take_prompt_context: Optional[str] = None
 
-    def to_dict(self) -> dict:
-        d = asdict(self)
-        return {k: v for k, v in d.items() if v is not None and not k.startswith("_")}
-
 
 # ================================================================
 # VERDICT SELECTION — deterministic
@@ -105,17 +114,25 @@ VERDICT_TO_UI = {
 }
 
 
+def _fallback_goal_label(goal_key: str) -> Tuple[str, str]:
+    return goal_key.replace("_", " ").title(), "·"
+
+
 def build_goal_chips(goal_verdicts: list) -> List[GoalChip]:
     chips = []
     for gv in goal_verdicts:
         if isinstance(gv, dict):
-            goal_key = gv.get("goal", "").lower().replace(" ", "_")
+            goal_key = gv.get("goal", "")
             v = gv.get("verdict", "caution")
+            # Serialized goals are normally already GOAL_LABELS keys;
+            # normalize only on a miss
+            if goal_key not in GOAL_LABELS:
+                goal_key = goal_key.lower().replace(" ", "_")
         else:
-            goal_key = gv.goal.value if hasattr(gv.goal, "value") else str(gv.goal).lower()
+            goal_key = gv.goal.value if isinstance(gv.goal, Enum) else str(gv.goal).lower()
             v = gv.verdict
 
-        label, icon = GOAL_LABELS.get(goal_key, (goal_key.replace("_", " ").title(), "·"))
+        label, icon = GOAL_LABELS.get(goal_key) or _fallback_goal_label(goal_key)
         verdict_ui = VERDICT_TO_UI.get(v, "mixed")
         chips.append(GoalChip(goal=label, icon=icon, verdict=verdict_ui))
 
@@ -127,17 +144,17 @@ def build_goal_chips(goal_verdicts: list) -> List[GoalChip]:
 # ================================================================
 
 SEARCH_PILL_BANK = {
-    "fabric_structure":     ["sculpting {g}", "ponte {g}", "structured knit", "double-lined"],
-    "bodycon_cling":        ["smoothing {g}", "sculpting {g}", "compression", "ponte"],
-    "hemline":              ["petite {g}", "mini length", "above-knee {g}"],
-    "hemline_long":         ["midi {g}", "knee-length {g}"],
-    "rise_elongation":      ["high-waist {g}", "high-rise {g}"],
-    "v_neck_elongation":    ["V-neck {g}", "wrap {g}"],
-    "a_line_hip":           ["A-line {g}", "fit-and-flare {g}"],
-    "wide_leg":             ["wide-leg pants", "palazzo pants", "straight-leg"],
-    "sleeve_endpoint":      ["three-quarter sleeve {g}", "long sleeve {g}"],
-    "monochrome_column":    ["monochrome {g}", "column of color", "tonal dressing"],
-    "_default":             ["structured {g}", "sculpting {g}"],
+    "fabric_structure":     ("sculpting {g}", "ponte {g}", "structured knit", "double-lined"),
+    "bodycon_cling":        ("smoothing {g}", "sculpting {g}", "compression", "ponte"),
+    "hemline":              ("petite {g}", "mini length", "above-knee {g}"),
+    "hemline_long":         ("midi {g}", "knee-length {g}"),
+    "rise_elongation":      ("high-waist {g}", "high-rise {g}"),
+    "v_neck_elongation":    ("V-neck {g}", "wrap {g}"),
+    "a_line_hip":           ("A-line {g}", "fit-and-flare {g}"),
+    "wide_leg":             ("wide-leg pants", "palazzo pants", "straight-leg"),
+    "sleeve_endpoint":      ("three-quarter sleeve {g}", "long sleeve {g}"),
+    "monochrome_column":    ("monochrome {g}", "column of color", "tonal dressing"),
+    "_default":             ("structured {g}", "sculpting {g}"),
 }
 
 SEARCH_CONTEXT_BANK = {
@@ -160,18 +177,37 @@ GARMENT_WORD_MAP = {
 
 
 def _garment_word(category: str) -> str:
-    if hasattr(category, "value"):
+    if isinstance(category, Enum):
         category = category.value
     return GARMENT_WORD_MAP.get(category.lower(), "garment")
 
 
+# SEARCH_PILL_BANK with {g} already filled in for every garment word:
+# (negative key, garment word) -> first four pills
+_EXPANDED_PILLS = {
+    (neg_key, g): tuple(t.replace("{g}", g) for t in templates[:4])
+    for neg_key, templates in SEARCH_PILL_BANK.items()
+    for g in {*GARMENT_WORD_MAP.values(), "garment"}
+}
+
+
 def build_search_pills(verdict: str, top_negative_key: str,
                         garment_category: str = "dress") -> Optional[List[str]]:
     if verdict == "this_is_it":
         return None
     g = _garment_word(garment_category)
-    templates = SEARCH_PILL_BANK.get(top_negative_key, SEARCH_PILL_BANK["_default"])
-    return [t.replace("{g}", g) for t in templates[:4]]
+    if top_negative_key not in SEARCH_PILL_BANK:
+        top_negative_key = "_default"
+    return list(_EXPANDED_PILLS[(top_negative_key, g)])
+
+
+# SEARCH_CONTEXT_BANK with {g} already filled in for every garment word:
+# (negative key, garment word) -> context line
+_EXPANDED_SEARCH_CONTEXT = {
+    (neg_key, g): template.replace("{g}", g)
+    for neg_key, template in SEARCH_CONTEXT_BANK.items()
+    for g in {*GARMENT_WORD_MAP.values(), "garment"}
+}
 
 
 def build_search_context(verdict: str, top_negative_key: str,
@@ -179,8 +215,9 @@ def build_search_context(verdict: str, top_negative_key: str,
     if verdict == "this_is_it":
         return None
     g = _garment_word(garment_category)
-    template = SEARCH_CONTEXT_BANK.get(top_negative_key, SEARCH_CONTEXT_BANK["_default"])
-    return template.replace("{g}", g)
+    if top_negative_key not in SEARCH_CONTEXT_BANK:
+        top_negative_key = "_default"
+    return _EXPANDED_SEARCH_CONTEXT[(top_negative_key, g)]
 
 
 # ================================================================
@@ -189,57 +226,77 @@ def build_search_context(verdict: str, top_negative_key: str,
 
 CHAT_CHIP_BANK = {
     "this_is_it": {
-        "dress": ["What shoes work?", "Office appropriate?", "What jacket pairs with this?"],
-        "top": ["What bottom works?", "How should I style it?", "Tuck or untuck?"],
-        "bottom_pants": ["What top goes with this?", "Office appropriate?", "Find more like this"],
-        "skirt": ["What top pairs?", "What shoes work?", "For a date night?"],
-        "_default": ["How should I style this?", "Find more like this", "Worth the price?"],
+        "dress": ("What shoes work?", "Office appropriate?", "What jacket pairs with this?"),
+        "top": ("What bottom works?", "How should I style it?", "Tuck or untuck?"),
+        "bottom_pants": ("What top goes with this?", "Office appropriate?", "Find more like this"),
+        "skirt": ("What top pairs?", "What shoes work?", "For a date night?"),
+        "_default": ("How should I style this?", "Find more like this", "Worth the price?"),
     },
     "smart_pick": {
-        "dress": ["What shoes work?", "Worth the alteration?", "Find similar but shorter?"],
-        "bottom_pants": ["Will the waist stretch?", "Worth the price?", "What belt works?"],
-        "_default": ["How do I fix this?", "Worth the price?", "Find something similar?"],
+        "dress": ("What shoes work?", "Worth the alteration?", "Find similar but shorter?"),
+        "bottom_pants": ("Will the waist stretch?", "Worth the price?", "What belt works?"),
+        "_default": ("How do I fix this?", "Worth the price?", "Find something similar?"),
     },
     "not_this_one": {
-        "dress": ["Find me a structured version", "What fabric should I look for?", "Will a jacket help?"],
-        "bottom_pants": ["Find a high-rise version", "What cut works for me?", "Show me better options"],
-        "_default": ["Find me something better", "What should I look for?", "What will work for my goals?"],
+        "dress": ("Find me a structured version", "What fabric should I look for?", "Will a jacket help?"),
+        "bottom_pants": ("Find a high-rise version", "What cut works for me?", "Show me better options"),
+        "_default": ("Find me something better", "What should I look for?", "What will work for my goals?"),
     },
 }
 
 
+# CHAT_CHIP_BANK flattened with the "_default" fallback already applied:
+# (verdict, category) -> first three chips
+_CHAT_TABLE = {
+    (verdict, cat): by_cat.get(cat, by_cat.get("_default", ()))[:3]
+    for verdict, by_cat in CHAT_CHIP_BANK.items()
+    for cat in {*GARMENT_WORD_MAP, *by_cat, "_default"}
+}
+
+
 def build_chat_chips(verdict: str, garment_category: str = "dress") -> List[str]:
-    cat = garment_category.lower() if isinstance(garment_category, str) else garment_category.value
-    verdict_chips = CHAT_CHIP_BANK.get(verdict, CHAT_CHIP_BANK["smart_pick"])
-    return verdict_chips.get(cat, verdict_chips.get("_default", []))[:3]
+    cat = garment_category.value if isinstance(garment_category, Enum) else garment_category.lower()
+    chips = _CHAT_TABLE.get((verdict, cat))
+    if chips is None:
+        if verdict not in CHAT_CHIP_BANK:
+            verdict = "smart_pick"
+        chips = _CHAT_TABLE.get((verdict, cat), _CHAT_TABLE[(verdict, "_default")])
+    return list(chips)
 
 
 # ================================================================
 # USER LINE — deterministic
 # ================================================================
 
+@functools.lru_cache(maxsize=256)
 def _inches_to_display(inches: float) -> str:
+    # Keyed on the raw height; heights repeat across requests, and the
+    # floor/mod math below is left as-is for fractional values
     feet = int(inches // 12)
     remaining = int(inches % 12)
     return f"{feet}'{remaining}\""
 
 
 def build_user_line(body_profile: dict) -> str:
-    parts = []
-    name = body_profile.get("name", "You")
-    parts.append(f"For {name}")
+    return build_user_line_fields(
+        body_profile.get("name", "You"),
+        body_profile.get("height", 0),
+        body_profile.get("body_shape", ""),
+        body_profile.get("torso_leg_ratio", 0.50),
+    )
+
+
+def build_user_line_fields(name: str, height: float, shape, ratio: float) -> str:
+    parts = [f"For {name}"]
 
-    height = body_profile.get("height", 0)
     if height:
         parts.append(_inches_to_display(height))
 
-    shape = body_profile.get("body_shape", "")
     if shape:
-        if hasattr(shape, "value"):
+        if isinstance(shape, Enum):
             shape = shape.value
         parts.append(shape.replace("_", " ").title())
 
-    ratio = body_profile.get("torso_leg_ratio", 0.50)
     if ratio < 0.48:
         parts.append("Short torso")
     elif ratio > 0.52:
@@ -338,7 +395,7 @@ def build_triple_checks(verdict: str, principle_scores: list) -> Optional[List[s
             name = p.name
 
         if score > 0.05:
-            key = name.lower().strip().replace(" ", "_").replace("-", "_")
+            key = name.lower().strip().translate(_KEY_SEPARATORS)
             positives.append((score, key))
 
     positives.sort(reverse=True)
@@ -374,35 +431,46 @@ PRINCIPLE_KEY_MAP = {
 }
 
 
+# Spaces and hyphens -> underscores, in one str.translate pass
+_KEY_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_principle_key(name: str) -> str:
-    key = name.lower().strip().replace(" ", "_").replace("-", "_")
+    key = name.lower().strip().translate(_KEY_SEPARATORS)
     return PRINCIPLE_KEY_MAP.get(key, key)
 
 
 def analyze_principles(principle_scores: list) -> dict:
-    applicable = []
+    # Single pass: filter, split by sign and compute the weighted sort key
+    pos_scratch = []
+    neg_scratch = []
     for p in principle_scores:
         if isinstance(p, dict):
             if not p.get("applicable", True):
                 continue
-            applicable.append(p)
+            score = p["score"]
+            weight = p.get("weight", 1.0)
         else:
             if not getattr(p, "applicable", True):
                 continue
-            applicable.append({
-                "name": p.name, "score": p.score,
-                "weight": getattr(p, "weight", 1.0),
+            score = p.score
+            weight = getattr(p, "weight", 1.0)
+            p = {
+                "name": p.name, "score": score,
+                "weight": weight,
                 "reasoning": getattr(p, "reasoning", ""),
-            })
-
-    positives = sorted(
-        [p for p in applicable if p["score"] > 0.05],
-        key=lambda x: x["score"] * x.get("weight", 1.0), reverse=True,
-    )
-    negatives = sorted(
-        [p for p in applicable if p["score"] < -0.05],
-        key=lambda x: x["score"] * x.get("weight", 1.0),
-    )
+            }
+        if score > 0.05:
+            pos_scratch.append((score * weight, p))
+        elif score < -0.05:
+            neg_scratch.append((score * weight, p))
+
+    # Sort on the key only (stable, like sorted(key=...))
+    pos_scratch.sort(key=itemgetter(0), reverse=True)
+    neg_scratch.sort(key=itemgetter(0))
+    positives = [p for _, p in pos_scratch]
+    negatives = [p for _, p in neg_scratch]
 
     top_pos_key = normalize_principle_key(positives[0]["name"]) if positives else None
     top_neg_key = normalize_principle_key(negatives[0]["name"]) if negatives else None
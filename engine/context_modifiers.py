@@ -7,7 +7,7 @@ golden registry context_rules.json (47 rules).
 These modifiers adjust scores in Layer 6 of the pipeline.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .schemas import (
     BodyProfile, GarmentProfile, PrincipleResult,
@@ -35,6 +35,15 @@ _COLOR_SYMBOLISM = {
     },
 }
 
+# _COLOR_SYMBOLISM flattened: (culture, color, event_type) -> score.
+# An event missing here falls back to the (culture, color, "general") entry.
+_COLOR_SYMBOLISM_FLAT: Dict[Tuple[str, str, str], float] = {
+    (culture, color, event): score
+    for culture, colors in _COLOR_SYMBOLISM.items()
+    for color, events in colors.items()
+    for event, score in events.items()
+}
+
 # Occasion coverage requirements
 _OCCASION_COVERAGE = {
     "formal": {
@@ -104,16 +113,20 @@ _HEM_ORDER = [
     "floor", "ankle", "below_calf", "midi", "below_knee",
     "knee", "above_knee", "mini",
 ]
+_HEM_RANK = {name: i for i, name in enumerate(_HEM_ORDER)}
+
+# _OCCASION_COVERAGE reduced to what the coverage check reads:
+# occasion -> (min hem rank or None, max neckline depth)
+_OCCASION_LIMITS = {
+    occasion: (_HEM_RANK.get(reqs["min_hem"]), reqs.get("max_neckline_depth", 99))
+    for occasion, reqs in _OCCASION_COVERAGE.items()
+}
 
 
-def _hem_is_above(actual: str, minimum: str) -> bool:
-    """Check if actual hem position is above (shorter than) the minimum."""
-    try:
-        actual_idx = _HEM_ORDER.index(actual)
-        min_idx = _HEM_ORDER.index(minimum)
-        return actual_idx > min_idx  # higher index = shorter
-    except ValueError:
-        return False
+# Context keys read by apply_context_modifiers
+_CONTEXT_KEYS = frozenset((
+    "culture", "event_type", "garment_color", "occasion", "climate", "age_range",
+))
 
 
 # ================================================================
@@ -141,30 +154,35 @@ def apply_context_modifiers(
         Dict of adjustment names -> score deltas
     """
     adjustments: Dict[str, float] = {}
+    if not context or context.keys().isdisjoint(_CONTEXT_KEYS):
+        return adjustments
 
     # ── Cultural color modifiers ──
     culture = context.get("culture", "").lower()
     event_type = context.get("event_type", "general")
     garment_color = context.get("garment_color", "").lower()
 
-    if culture in _COLOR_SYMBOLISM and garment_color:
-        color_rules = _COLOR_SYMBOLISM[culture].get(garment_color, {})
-        cultural_score = color_rules.get(event_type, color_rules.get("general", 0.0))
+    if garment_color:
+        cultural_score = _COLOR_SYMBOLISM_FLAT.get((culture, garment_color, event_type))
+        if cultural_score is None:
+            cultural_score = _COLOR_SYMBOLISM_FLAT.get((culture, garment_color, "general"), 0.0)
         if cultural_score != 0.0:
             adjustments["cultural_color"] = cultural_score
 
     # ── Occasion coverage check ──
     occasion = context.get("occasion", "").lower()
-    if occasion in _OCCASION_COVERAGE:
-        reqs = _OCCASION_COVERAGE[occasion]
+    limits = _OCCASION_LIMITS.get(occasion)
+    if limits is not None:
+        min_hem_rank, max_neckline_depth = limits
 
-        # Hemline check
-        if _hem_is_above(garment.hem_position, reqs["min_hem"]):
+        # Hemline check (higher rank = shorter)
+        hem_rank = _HEM_RANK.get(garment.hem_position)
+        if hem_rank is not None and min_hem_rank is not None and hem_rank > min_hem_rank:
             adjustments["occasion_hem_violation"] = -0.20
 
         # Neckline depth check
         neckline_depth = garment.neckline_depth or (garment.v_depth_cm / 2.54)
-        if neckline_depth > reqs.get("max_neckline_depth", 99):
+        if neckline_depth > max_neckline_depth:
             adjustments["occasion_neckline_violation"] = -0.15
 
     # ── Climate modifiers ──
@@ -182,15 +200,17 @@ def apply_context_modifiers(
 
     # ── Age range modifiers (subtle) ──
     age_range = context.get("age_range", "")
-    if age_range == "50+":
-        # Slightly prefer structured over bodycon for comfort
-        for p in principles:
-            if p.name == "Bodycon Mapping" and p.score > 0.20:
+    if age_range in ("50+", "18-25"):
+        by_name = {p.name: p for p in principles}
+        if age_range == "50+":
+            # Slightly prefer structured over bodycon for comfort
+            p = by_name.get("Bodycon Mapping")
+            if p is not None and p.score > 0.20:
                 adjustments["age_bodycon_comfort"] = -0.05
-    elif age_range == "18-25":
-        # Trend-forward tolerance slightly higher
-        for p in principles:
-            if p.name == "Tent Concealment" and p.score < -0.20:
+        else:
+            # Trend-forward tolerance slightly higher
+            p = by_name.get("Tent Concealment")
+            if p is not None and p.score < -0.20:
                 adjustments["age_oversized_trend"] = +0.05
 
     return adjustments
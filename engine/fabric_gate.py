@@ -9,12 +9,13 @@ Source: Domain 3 (kridha_scoring_engine.py) — fabric resolution, cling model,
 photo-to-reality discount, gate rules.
 """
 
+import functools
 import math
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
 from .schemas import (
-    BodyProfile, GarmentProfile, ExceptionTriggered,
+    BodyProfile, GarmentProfile, ExceptionTriggered, BrandTier,
     FabricConstruction, SurfaceFinish, Silhouette, NecklineType,
     clamp,
 )
@@ -23,6 +24,12 @@ from .rules_data import (
     FABRIC_LOOKUP, get_fabric_data,
 )
 
+# ELASTANE_MULTIPLIERS / SHEEN_MAP keyed by enum member, defaults applied
+_ELASTANE_MULT_BY_CONSTRUCTION = {
+    c: ELASTANE_MULTIPLIERS.get(c.value, 2.0) for c in FabricConstruction
+}
+_SHEEN_BY_SURFACE = {s: SHEEN_MAP.get(s.value, 0.10) for s in SurfaceFinish}
+
 
 # ================================================================
 # RESOLVED FABRIC PROPERTIES
@@ -55,8 +62,7 @@ def resolve_fabric_properties(garment: GarmentProfile) -> ResolvedFabric:
         fabric_data = get_fabric_data(garment.fabric_name)
 
     # Construction multiplier
-    construction_key = garment.construction.value
-    elastane_mult = ELASTANE_MULTIPLIERS.get(construction_key, 2.0)
+    elastane_mult = _ELASTANE_MULT_BY_CONSTRUCTION[garment.construction]
     total_stretch = garment.elastane_pct * elastane_mult
 
     # If fabric lookup provides typical_stretch and we have no elastane info, use it
@@ -68,7 +74,7 @@ def resolve_fabric_properties(garment: GarmentProfile) -> ResolvedFabric:
     effective_gsm = garment.gsm_estimated * fiber_mult
 
     # Sheen score
-    sheen = SHEEN_MAP.get(garment.surface.value, 0.10)
+    sheen = _SHEEN_BY_SURFACE[garment.surface]
 
     # Drape coefficient (convert 1-10 scale to %)
     drape_coeff = garment.drape * 10.0
@@ -158,6 +164,13 @@ _ZONE_GAP_COEFFICIENTS = {
     "thigh": 0.07,
 }
 
+# (reference, coefficient) per zone, in bust/waist/hip/upper_arm/thigh order,
+# unpacked by _photo_gap
+_ZONE_REF_COEFFS = tuple(
+    (_REF_MODEL[zone], _ZONE_GAP_COEFFICIENTS.get(zone, 0.05))
+    for zone in ("bust", "waist", "hip", "upper_arm", "thigh")
+)
+
 # Brand tier multipliers for photo accuracy
 _BRAND_MULTIPLIERS = {
     "luxury": 0.85,        # photos closer to reality
@@ -166,6 +179,23 @@ _BRAND_MULTIPLIERS = {
     "mass_market": 1.10,
     "fast_fashion": 1.20,  # photos most misleading
 }
+# Same, keyed by BrandTier member with the 1.0 default applied
+_BRAND_MULT_BY_TIER = {t: _BRAND_MULTIPLIERS.get(t.value, 1.0) for t in BrandTier}
+
+
+def _photo_gap(
+    bust: float, waist: float, hip: float, upper_arm: float, thigh: float,
+) -> float:
+    """Coefficient-weighted circumference gap between body and photo model."""
+    (ref_bust, k_bust), (ref_waist, k_waist), (ref_hip, k_hip), \
+        (ref_arm, k_arm), (ref_thigh, k_thigh) = _ZONE_REF_COEFFS
+    return (
+        abs(bust - ref_bust) * k_bust
+        + abs(waist - ref_waist) * k_waist
+        + abs(hip - ref_hip) * k_hip
+        + abs(upper_arm - ref_arm) * k_arm
+        + abs(thigh - ref_thigh) * k_thigh
+    )
 
 
 def photo_to_reality_discount(
@@ -176,30 +206,53 @@ def photo_to_reality_discount(
 
     Returns discount 0.0 (identical to photo) to 0.55 (very different).
     """
-    total_gap = 0.0
-    zones = {
-        "bust": (body.bust, _REF_MODEL["bust"]),
-        "waist": (body.waist, _REF_MODEL["waist"]),
-        "hip": (body.hip, _REF_MODEL["hip"]),
-        "upper_arm": (body.c_upper_arm_max, _REF_MODEL["upper_arm"]),
-        "thigh": (body.c_thigh_max, _REF_MODEL["thigh"]),
-    }
+    return _photo_discount_cached(
+        body.bust, body.waist, body.hip, body.c_upper_arm_max, body.c_thigh_max,
+        garment.brand_tier,
+    )
 
-    for zone_name, (user_circ, model_circ) in zones.items():
-        gap = abs(user_circ - model_circ)
-        coeff = _ZONE_GAP_COEFFICIENTS.get(zone_name, 0.05)
-        total_gap += gap * coeff
 
-    brand_mult = _BRAND_MULTIPLIERS.get(garment.brand_tier.value, 1.0)
+@functools.lru_cache(maxsize=4096)
+def _photo_discount_cached(
+    bust: float, waist: float, hip: float, upper_arm: float, thigh: float,
+    brand_tier: BrandTier,
+) -> float:
+    # Memoized on the exact measurements and tier: a session re-scores the
+    # same body against many garments, and there are only five tiers
+    total_gap = _photo_gap(bust, waist, hip, upper_arm, thigh)
+
+    brand_mult = _BRAND_MULT_BY_TIER[brand_tier]
     discount = min(0.55, total_gap * brand_mult)
 
     return discount
 
 
+def photo_to_reality_discount_batch(
+    garments: List[GarmentProfile], body: BodyProfile
+) -> List[float]:
+    """photo_to_reality_discount for many garments against one body.
+
+    Only the brand tier varies per garment, so the body gap is computed
+    once and the discount once per tier.
+    """
+    total_gap = _photo_gap(
+        body.bust, body.waist, body.hip, body.c_upper_arm_max, body.c_thigh_max,
+    )
+    by_tier = {
+        tier: min(0.55, total_gap * mult)
+        for tier, mult in _BRAND_MULT_BY_TIER.items()
+    }
+    return [by_tier[g.brand_tier] for g in garments]
+
+
 # ================================================================
 # GATE RULES — Boolean checks that trigger exceptions
 # ================================================================
 
+# Silhouettes exempt from the fluid-fabric belly gate (Gate 5)
+_BODY_SKIMMING_SILHOUETTES = frozenset((Silhouette.FITTED, Silhouette.SEMI_FITTED))
+
+
 def run_fabric_gates(
     garment: GarmentProfile,
     body: BodyProfile,
@@ -207,28 +260,31 @@ def run_fabric_gates(
 ) -> List[ExceptionTriggered]:
     """Run all fabric gate rules and return triggered exceptions."""
     exceptions = []
+    sheen = resolved.sheen_score
+    drape_coefficient = resolved.drape_coefficient
+    silhouette = garment.silhouette
+    belly_zone = body.belly_zone
 
     # Gate 1: Dark + shiny inversion
-    if garment.is_dark and resolved.sheen_score > 0.50:
+    if sheen > 0.50 and garment.is_dark:
         exceptions.append(ExceptionTriggered(
             exception_id="GATE_DARK_SHINY",
             rule_overridden="dark_slimming",
             reason=(
                 f"Dark (L={garment.color_lightness:.2f}) + high sheen "
-                f"(SI={resolved.sheen_score:.2f}): sheen amplifies body "
+                f"(SI={sheen:.2f}): sheen amplifies body "
                 f"contours, partially negating dark slimming benefit"
             ),
             confidence=0.80,
         ))
 
     # Gate 2: A-line drape override (shelf effect)
-    if (garment.silhouette == Silhouette.A_LINE and
-            resolved.drape_coefficient >= 65):
+    if silhouette == Silhouette.A_LINE and drape_coefficient >= 65:
         exceptions.append(ExceptionTriggered(
             exception_id="GATE_ALINE_SHELF",
             rule_overridden="aline_balance",
             reason=(
-                f"A-line + stiff fabric (DC={resolved.drape_coefficient:.0f}%): "
+                f"A-line + stiff fabric (DC={drape_coefficient:.0f}%): "
                 f"fabric won't drape, creates shelf effect at hips"
             ),
             confidence=0.82,
@@ -262,29 +318,27 @@ def run_fabric_gates(
         ))
 
     # Gate 5: Fluid fabric at apple belly
-    if (resolved.drape_coefficient > 60 and body.belly_zone > 0.3 and
-            garment.silhouette not in (
-                Silhouette.FITTED, Silhouette.SEMI_FITTED)):
+    if (drape_coefficient > 60 and belly_zone > 0.3 and
+            silhouette not in _BODY_SKIMMING_SILHOUETTES):
         exceptions.append(ExceptionTriggered(
             exception_id="GATE_FLUID_APPLE_BELLY",
             rule_overridden="tent_concealment",
             reason=(
-                f"Fluid/drapey fabric (DC={resolved.drape_coefficient:.0f}%) "
-                f"on belly concern zone ({body.belly_zone:.2f}): "
+                f"Fluid/drapey fabric (DC={drape_coefficient:.0f}%) "
+                f"on belly concern zone ({belly_zone:.2f}): "
                 f"fabric clings to belly contour instead of skimming"
             ),
             confidence=0.72,
         ))
 
     # Gate 6: Cling trap — matte but clingy on curves
-    if (resolved.sheen_score < 0.30 and resolved.cling_risk_base > 0.6 and
-            (body.is_plus_size or body.hip_zone > 0.5 or
-             body.belly_zone > 0.5)):
+    if (sheen < 0.30 and resolved.cling_risk_base > 0.6 and
+            (body.is_plus_size or body.hip_zone > 0.5 or belly_zone > 0.5)):
         exceptions.append(ExceptionTriggered(
             exception_id="GATE_CLING_TRAP",
             rule_overridden="matte_zone",
             reason=(
-                f"Matte (SI={resolved.sheen_score:.2f}) but clingy "
+                f"Matte (SI={sheen:.2f}) but clingy "
                 f"(cling={resolved.cling_risk_base:.2f}): creates "
                 f"second-skin effect on curves, overriding matte benefit"
             ),
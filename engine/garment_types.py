@@ -9,12 +9,13 @@ Each garment type only scores the zones it controls:
 - Jackets are scored independently AND as layer modifiers
 """
 
-from typing import Dict, List, Set, Tuple
+import functools
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple
 
 from .schemas import (
     BodyProfile, GarmentProfile, BodyShape, StylingGoal,
     GarmentCategory, GarmentLayer, TopHemBehavior,
-    Silhouette, clamp,
+    FabricConstruction, Silhouette, clamp,
 )
 
 
@@ -24,41 +25,43 @@ from .schemas import (
 
 # Which existing scorers to SKIP for each garment type.
 # If category not listed, all 16 scorers run (dress-like).
-_SCORERS_TO_SKIP: Dict[GarmentCategory, Set[str]] = {
-    GarmentCategory.DRESS: set(),
-    GarmentCategory.TOP: {"Hemline"},
-    GarmentCategory.SWEATSHIRT: {"Hemline"},
-    GarmentCategory.BODYSUIT: {"Hemline"},
-    GarmentCategory.BOTTOM_PANTS: {
+_SCORERS_TO_SKIP: Dict[GarmentCategory, FrozenSet[str]] = {
+    GarmentCategory.DRESS: frozenset(),
+    GarmentCategory.TOP: frozenset({"Hemline"}),
+    GarmentCategory.SWEATSHIRT: frozenset({"Hemline"}),
+    GarmentCategory.BODYSUIT: frozenset({"Hemline"}),
+    GarmentCategory.BOTTOM_PANTS: frozenset({
         "V-Neck Elongation", "Neckline Compound", "Sleeve",
         "Rise Elongation", "Hemline",
-    },
-    GarmentCategory.BOTTOM_SHORTS: {
+    }),
+    GarmentCategory.BOTTOM_SHORTS: frozenset({
         "V-Neck Elongation", "Neckline Compound", "Sleeve",
         "Rise Elongation", "Hemline",
-    },
-    GarmentCategory.SKIRT: {
+    }),
+    GarmentCategory.SKIRT: frozenset({
         "V-Neck Elongation", "Neckline Compound", "Sleeve",
         "Rise Elongation",
-    },
-    GarmentCategory.JUMPSUIT: set(),
-    GarmentCategory.ROMPER: set(),
-    GarmentCategory.JACKET: {"Hemline"},
-    GarmentCategory.COAT: set(),
-    GarmentCategory.CARDIGAN: {"Hemline"},
-    GarmentCategory.VEST: {"Hemline", "Sleeve"},
+    }),
+    GarmentCategory.JUMPSUIT: frozenset(),
+    GarmentCategory.ROMPER: frozenset(),
+    GarmentCategory.JACKET: frozenset({"Hemline"}),
+    GarmentCategory.COAT: frozenset(),
+    GarmentCategory.CARDIGAN: frozenset({"Hemline"}),
+    GarmentCategory.VEST: frozenset({"Hemline", "Sleeve"}),
 }
 
+_NO_SKIPPED_SCORERS: FrozenSet[str] = frozenset()
+
 # Which NEW type-specific scorers to ADD for each category.
-_EXTRA_SCORERS: Dict[GarmentCategory, List[str]] = {
-    GarmentCategory.TOP: ["Top Hemline"],
-    GarmentCategory.SWEATSHIRT: ["Top Hemline"],
-    GarmentCategory.BODYSUIT: ["Top Hemline"],
-    GarmentCategory.CARDIGAN: ["Top Hemline"],
-    GarmentCategory.BOTTOM_PANTS: ["Pant Rise", "Leg Shape"],
-    GarmentCategory.BOTTOM_SHORTS: ["Pant Rise", "Leg Shape"],
-    GarmentCategory.JACKET: ["Jacket Scoring"],
-    GarmentCategory.COAT: ["Jacket Scoring"],
+_EXTRA_SCORERS: Dict[GarmentCategory, Tuple[str, ...]] = {
+    GarmentCategory.TOP: ("Top Hemline",),
+    GarmentCategory.SWEATSHIRT: ("Top Hemline",),
+    GarmentCategory.BODYSUIT: ("Top Hemline",),
+    GarmentCategory.CARDIGAN: ("Top Hemline",),
+    GarmentCategory.BOTTOM_PANTS: ("Pant Rise", "Leg Shape"),
+    GarmentCategory.BOTTOM_SHORTS: ("Pant Rise", "Leg Shape"),
+    GarmentCategory.JACKET: ("Jacket Scoring",),
+    GarmentCategory.COAT: ("Jacket Scoring",),
 }
 
 # Layer garment categories
@@ -86,14 +89,14 @@ TYPE_SCORER_WEIGHTS: Dict[str, float] = {
 }
 
 
-def get_scorers_to_skip(category: GarmentCategory) -> Set[str]:
+def get_scorers_to_skip(category: GarmentCategory) -> FrozenSet[str]:
     """Get set of existing scorer names to skip for this garment type."""
-    return _SCORERS_TO_SKIP.get(category, set())
+    return _SCORERS_TO_SKIP.get(category, _NO_SKIPPED_SCORERS)
 
 
-def get_extra_scorer_names(category: GarmentCategory) -> List[str]:
+def get_extra_scorer_names(category: GarmentCategory) -> Tuple[str, ...]:
     """Get names of additional type-specific scorers for this category."""
-    return _EXTRA_SCORERS.get(category, [])
+    return _EXTRA_SCORERS.get(category, ())
 
 
 def is_layer_garment(category: GarmentCategory) -> bool:
@@ -153,6 +156,31 @@ _TITLE_KEYWORDS: Dict[GarmentCategory, List[str]] = {
     GarmentCategory.LEHENGA: ["lehenga", "lehnga", "chaniya choli"],
 }
 
+# Every (keyword, category) pair in match priority order: longest keyword
+# first, equal lengths broken by keyword in descending order
+_TITLE_KEYWORD_ORDER: Tuple[Tuple[str, GarmentCategory], ...] = tuple(sorted(
+    ((keyword, category)
+     for category, keywords in _TITLE_KEYWORDS.items()
+     for keyword in keywords),
+    key=lambda pair: (len(pair[0]), pair[0]),
+    reverse=True,
+))
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_title_keyword(title: str):
+    """Return the category of the highest-priority keyword in title
+    (matched case-insensitively), or None.
+
+    Memoized on the raw title: the same product titles are classified on
+    every re-score, so repeats skip both the lowercasing and the scan.
+    """
+    title = title.lower()
+    for keyword, category in _TITLE_KEYWORD_ORDER:
+        if keyword in title:
+            return category
+    return None
+
 
 def classify_garment(garment: GarmentProfile) -> GarmentCategory:
     """Classify garment type from title and attributes.
@@ -161,18 +189,12 @@ def classify_garment(garment: GarmentProfile) -> GarmentCategory:
     this is the fallback classification from garment signals.
     Uses longest-match-wins across all categories.
     """
-    title = (garment.title or "").lower()
+    title = garment.title
 
     if title:
-        # Build all (keyword, category) pairs, check longest first
-        all_matches = []
-        for category, keywords in _TITLE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in title:
-                    all_matches.append((len(keyword), keyword, category))
-        if all_matches:
-            all_matches.sort(reverse=True)  # longest keyword wins
-            return all_matches[0][2]
+        category = _match_title_keyword(title)
+        if category is not None:
+            return category
 
     # Attribute-based fallback
     if garment.rise is not None and garment.leg_shape is not None:
@@ -238,7 +260,7 @@ def score_top_hemline(
         return clamp(score), " | ".join(R)
 
     if behavior == TopHemBehavior.BODYSUIT:
-        return clamp(0.10), "Bodysuit: no visible hem, smooth line +0.10"
+        return 0.10, "Bodysuit: no visible hem, smooth line +0.10"
 
     # CROPPED: visual break above natural waist
     if behavior == TopHemBehavior.CROPPED or hem_pos == "cropped":
@@ -270,7 +292,7 @@ def score_top_hemline(
         return clamp(score), " | ".join(R)
 
     if hem_pos == "just_below_waist":
-        return clamp(0.15), "Just below waist: slight torso lengthening (+0.15)"
+        return 0.15, "Just below waist: slight torso lengthening (+0.15)"
 
     if hem_pos == "at_hip":
         R.append("At hip: critical zone")
@@ -374,7 +396,7 @@ def score_pant_rise(
         return clamp(score), " | ".join(R)
 
     if rise == "mid":
-        return clamp(0.05), "Mid rise: neutral-positive +0.05"
+        return 0.05, "Mid rise: neutral-positive +0.05"
 
     if rise == "low":
         score = -0.15
@@ -397,6 +419,16 @@ def score_pant_rise(
     return 0.0, f"Rise '{rise}' — N/A"
 
 
+# Elastane stretch multiplier for leg cling, keyed by construction member
+_LEG_CONSTRUCTION_MULT: Dict[FabricConstruction, float] = {
+    FabricConstruction.WOVEN: 1.6,
+    FabricConstruction.KNIT: 4.0,
+    FabricConstruction.KNIT_RIB: 5.5,
+    FabricConstruction.KNIT_DOUBLE: 3.5,
+    FabricConstruction.KNIT_JERSEY: 4.0,
+}
+
+
 def score_leg_shape(
     g: GarmentProfile, b: BodyProfile
 ) -> Tuple[float, str]:
@@ -411,17 +443,14 @@ def score_leg_shape(
         return 0.0, "No leg shape data — N/A"
 
     body_shape = b.body_shape
+    rise = g.rise
+    rise_is_high = rise in ("high", "ultra_high")
 
     # Compute thigh cling penalty for skinny/slim legs
     thigh_cling_penalty = 0.0
     if leg in ("skinny", "slim"):
         ease = 1.0 if leg == "skinny" else 2.0
-        _CONSTRUCTION_MULT = {
-            "woven": 1.6, "knit": 4.0, "knit_rib": 5.5,
-            "knit_double": 3.5, "knit_jersey": 4.0,
-        }
-        constr_val = g.construction.value if hasattr(g.construction, 'value') else str(g.construction)
-        total_stretch = g.elastane_pct * _CONSTRUCTION_MULT.get(constr_val, 2.0)
+        total_stretch = g.elastane_pct * _LEG_CONSTRUCTION_MULT.get(g.construction, 2.0)
         if total_stretch < 8 and b.c_thigh_max > 24:
             thigh_cling_penalty = -0.10
             R.append(f"Low-stretch skinny + large thigh ({b.c_thigh_max:.0f}\"): cling risk (-0.10)")
@@ -438,7 +467,7 @@ def score_leg_shape(
             else:
                 score = -0.10
                 R.append("Pear: shows hip curve (-0.10)")
-            if g.rise in ("high", "ultra_high"):
+            if rise_is_high:
                 score += 0.10
                 R.append("+ high rise: elongation partially offsets (+0.10)")
         elif body_shape == BodyShape.INVERTED_TRIANGLE:
@@ -458,7 +487,7 @@ def score_leg_shape(
     if leg in ("wide_leg", "palazzo"):
         R.append(f"{leg}: adds volume at leg")
         if b.is_petite:
-            if g.rise in ("high", "ultra_high"):
+            if rise_is_high:
                 score = 0.15
                 R.append("Petite + high rise: volume manageable (+0.15)")
             else:
@@ -467,25 +496,25 @@ def score_leg_shape(
         elif body_shape == BodyShape.PEAR:
             score = 0.40
             R.append("Pear: skims over hips and thighs (+0.40)")
-            if g.rise in ("high", "ultra_high"):
+            if rise_is_high:
                 score += 0.10
                 R.append("+ high rise: defines waist before volume starts (+0.10)")
-            elif g.rise == "low":
+            elif rise == "low":
                 score -= 0.20
                 R.append("+ low rise: volume starts too early, no waist anchor (-0.20)")
         elif body_shape == BodyShape.INVERTED_TRIANGLE:
             score = 0.40
             R.append("INVT: leg volume balances shoulders (+0.40)")
-            if g.rise in ("high", "ultra_high"):
+            if rise_is_high:
                 score += 0.05
                 R.append("+ high rise: clean proportion line (+0.05)")
         elif body_shape == BodyShape.APPLE:
             score = 0.25
             R.append("Apple: volume below balances midsection (+0.25)")
-            if g.rise in ("high", "ultra_high") and g.waistband_stretch_pct >= 8.0:
+            if rise_is_high and g.waistband_stretch_pct >= 8.0:
                 score += 0.10
                 R.append("+ stretch high rise: smooth waist transition (+0.10)")
-            elif g.rise == "low":
+            elif rise == "low":
                 score -= 0.15
                 R.append("+ low rise: gap at midsection (-0.15)")
         else:
@@ -493,7 +522,7 @@ def score_leg_shape(
         return clamp(score), " | ".join(R)
 
     if leg == "straight":
-        return clamp(0.15), "Straight: clean, balanced line (+0.15)"
+        return 0.15, "Straight: clean, balanced line (+0.15)"
 
     if leg in ("bootcut", "flare"):
         R.append(f"{leg}: volume at hem")
@@ -606,6 +635,15 @@ def score_jacket_scoring(
     return clamp(score), " | ".join(R)
 
 
+# Type-specific scorer functions, keyed by the names in _EXTRA_SCORERS
+TYPE_SCORER_FUNCS: Dict[str, Callable[[GarmentProfile, BodyProfile], Tuple[float, str]]] = {
+    "Top Hemline": score_top_hemline,
+    "Pant Rise": score_pant_rise,
+    "Leg Shape": score_leg_shape,
+    "Jacket Scoring": score_jacket_scoring,
+}
+
+
 # ================================================================
 # LAYER INTERACTION
 # ================================================================
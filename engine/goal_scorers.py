@@ -5,7 +5,7 @@ Maps user styling goals to principle scores and produces GoalVerdict
 for each active goal.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .schemas import (
     BodyProfile, PrincipleResult, GoalVerdict, StylingGoal,
@@ -184,30 +184,45 @@ GOAL_PRINCIPLE_MAP: Dict[StylingGoal, Dict[str, object]] = {
 # GOAL SCORING
 # ================================================================
 
+def _goal_terms(mapping: Dict[str, object]) -> Tuple[Tuple[Tuple[str, float], ...], ...]:
+    """(positive, negative) ``(name, weight)`` pairs for one goal mapping,
+    deduplicated in declared order."""
+    weights = mapping.get("weights", {})
+    return tuple(
+        tuple((name, weights.get(name, 1.0)) for name in dict.fromkeys(mapping[side]))
+        for side in ("positive", "negative")
+    )
+
+
+# GOAL_PRINCIPLE_MAP resolved once: goal -> (positive terms, negative terms)
+_GOAL_TERMS = {goal: _goal_terms(mapping) for goal, mapping in GOAL_PRINCIPLE_MAP.items()}
+_NO_TERMS = ((), ())
+
+
 def _score_single_goal(
     goal: StylingGoal,
     principles: List[PrincipleResult],
 ) -> GoalVerdict:
     """Score a single styling goal against principle results."""
-    mapping = GOAL_PRINCIPLE_MAP.get(goal, {"positive": [], "negative": [], "weights": {}})
+    return _score_goal(goal, {p.name: p for p in principles if p.applicable})
 
-    positive_names = set(mapping["positive"])
-    negative_names = set(mapping["negative"])
-    weights = mapping.get("weights", {})
+
+def _score_goal(
+    goal: StylingGoal,
+    by_name: Dict[str, PrincipleResult],
+) -> GoalVerdict:
+    """Score one goal given the applicable principles keyed by name."""
+    positive_terms, negative_terms = _GOAL_TERMS.get(goal, _NO_TERMS)
 
     weighted_sum = 0.0
     total_weight = 0.0
     supporting = []
 
-    # Build name -> result lookup
-    by_name = {p.name: p for p in principles if p.applicable}
-
     # Positive principles: higher score = better for this goal
-    for name in positive_names:
+    for name, w in positive_terms:
         p = by_name.get(name)
         if p is None:
             continue
-        w = weights.get(name, 1.0)
         weighted_sum += p.score * w
         total_weight += w
         if p.score > 0.05:
@@ -215,11 +230,10 @@ def _score_single_goal(
 
     # Negative principles: negative score = BETTER for this goal
     # (i.e., color break negative = good for look_taller)
-    for name in negative_names:
+    for name, w in negative_terms:
         p = by_name.get(name)
         if p is None:
             continue
-        w = weights.get(name, 1.0)
         # Invert: if the principle hurts the goal, a negative score there helps
         weighted_sum -= p.score * w
         total_weight += w
@@ -257,8 +271,7 @@ def score_goals(
     body: BodyProfile,
 ) -> List[GoalVerdict]:
     """Score all active styling goals for this body."""
-    verdicts = []
-    for goal in body.styling_goals:
-        verdict = _score_single_goal(goal, principles)
-        verdicts.append(verdict)
-    return verdicts
+    if not body.styling_goals:
+        return []
+    by_name = {p.name: p for p in principles if p.applicable}
+    return [_score_goal(goal, by_name) for goal in body.styling_goals]
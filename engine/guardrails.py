@@ -26,6 +26,10 @@ class GuardrailViolation:
     text: str
     suggestion: str = ""
 
+    def to_dict(self) -> dict:
+        return {"rule": self.rule, "severity": self.severity,
+                "text": self.text, "suggestion": self.suggestion}
+
 
 @dataclass
 class GuardrailResult:
@@ -16,7 +16,7 @@ Pipeline:
 """
 
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .schemas import (
     BodyProfile, GarmentProfile, ScoreResult, PrincipleResult,
@@ -43,9 +43,8 @@ from .context_modifiers import apply_context_modifiers
 from .garment_types import (
     get_scorers_to_skip, get_extra_scorer_names, is_layer_garment,
     classify_garment,
-    score_top_hemline, score_pant_rise, score_leg_shape,
-    score_jacket_scoring, compute_layer_modifications,
-    TYPE_SCORER_ZONE_MAPPING, TYPE_SCORER_WEIGHTS,
+    compute_layer_modifications,
+    TYPE_SCORER_FUNCS, TYPE_SCORER_ZONE_MAPPING, TYPE_SCORER_WEIGHTS,
 )
 
 
@@ -781,25 +780,8 @@ def score_sleeve(
     R.append(f"Sleeve endpoint {sleeve.endpoint_position:.1f}\", "
              f"delta={delta:+.2f}\", severity={severity:.1f}")
 
-    # Score from delta (domain 2 line ~4076)
-    if delta > 0.30:
-        score = -4.0
-    elif delta > 0.15:
-        score = -2.0
-    elif delta > 0:
-        score = -1.0
-    elif delta > -0.30:
-        score = 1.0
-    elif delta > -0.60:
-        score = 3.0
-    else:
-        score = 5.0
-
-    # Apply severity
-    if score < 0:
-        score *= severity
-    else:
-        score *= (1 + (severity - 1) * 0.5)
+    # Score from delta, severity-adjusted (domain 2 line ~4076)
+    score = sleeve.score_from_delta
 
     # Flutter vs cap bonus (domain 2 line ~4260)
     if g.sleeve_type == SleeveType.FLUTTER:
@@ -1172,6 +1154,28 @@ _GOAL_WEIGHT_BOOSTS: Dict[StylingGoal, Dict[str, float]] = {
 }
 
 
+def _body_goal_boosts(body: BodyProfile) -> Dict[str, Tuple[float, ...]]:
+    """Collect Layer 3 weight boosts per principle for this body's goals.
+
+    Multipliers are kept in goal order so they apply in the same sequence
+    as iterating body.styling_goals per principle.
+    """
+    boosts: Dict[str, List[float]] = {}
+    for goal in body.styling_goals:
+        for name, mult in _GOAL_WEIGHT_BOOSTS.get(goal, {}).items():
+            boosts.setdefault(name, []).append(mult)
+    return {name: tuple(mults) for name, mults in boosts.items()}
+
+
+def _body_has_slimming(body: BodyProfile) -> bool:
+    """Whether the silhouette dominance rule applies to this body."""
+    return (
+        _has_goal(body, StylingGoal.SLIMMING)
+        or _has_goal(body, StylingGoal.SLIM_HIPS)
+        or _has_goal(body, StylingGoal.HIDE_MIDSECTION)
+    )
+
+
 def score_garment(
     garment: GarmentProfile,
     body: BodyProfile,
@@ -1188,6 +1192,41 @@ def score_garment(
     Returns:
         ScoreResult with overall 0-10 score, breakdowns, and reasoning
     """
+    return _score_garment(
+        garment, body, context,
+        _body_goal_boosts(body), _body_has_slimming(body),
+    )
+
+
+def make_scorer(
+    body: BodyProfile,
+    context: Optional[dict] = None,
+) -> Callable[[GarmentProfile], ScoreResult]:
+    """
+    Build a garment scorer specialized for one body profile.
+
+    Body-level work (goal weight boosts, slimming-goal checks) is done
+    once here instead of once per garment. The returned scorer reflects
+    the body as it was when make_scorer() was called — build a new one
+    if the body profile or its styling goals change.
+    """
+    goal_boosts = _body_goal_boosts(body)
+    has_slimming = _body_has_slimming(body)
+
+    def _score(garment: GarmentProfile) -> ScoreResult:
+        return _score_garment(garment, body, context, goal_boosts, has_slimming)
+
+    return _score
+
+
+def _score_garment(
+    garment: GarmentProfile,
+    body: BodyProfile,
+    context: Optional[dict],
+    goal_boosts: Dict[str, Tuple[float, ...]],
+    has_slimming: bool,
+) -> ScoreResult:
+    """7-layer pipeline with body-level goal work precomputed."""
     reasoning_chain: List[str] = []
     exceptions: List[ExceptionTriggered] = []
     fixes: List[Fix] = []
@@ -1248,14 +1287,8 @@ def score_garment(
         ))
 
     # Add garment-type-specific scorers
-    _TYPE_SCORER_FUNCS = {
-        "Top Hemline": score_top_hemline,
-        "Pant Rise": score_pant_rise,
-        "Leg Shape": score_leg_shape,
-        "Jacket Scoring": score_jacket_scoring,
-    }
     for extra_name in get_extra_scorer_names(category):
-        scorer_fn = _TYPE_SCORER_FUNCS.get(extra_name)
+        scorer_fn = TYPE_SCORER_FUNCS.get(extra_name)
         if scorer_fn is None:
             continue
         try:
@@ -1285,10 +1318,8 @@ def score_garment(
     for result in principle_results:
         if not result.applicable:
             continue
-        for goal in body.styling_goals:
-            boosts = _GOAL_WEIGHT_BOOSTS.get(goal, {})
-            if result.name in boosts:
-                result.weight *= boosts[result.name]
+        for mult in goal_boosts.get(result.name, ()):
+            result.weight *= mult
 
         # Conservative negative amplification
         if result.score < -0.15:
@@ -1309,7 +1340,7 @@ def score_garment(
     )
 
     # ── Layer 5: Body-Type Parameterization ──
-    body_adjusted = translate_garment_to_body(garment, body)
+    body_adjusted = translate_garment_to_body(garment, body, resolved)
     reasoning_chain.append(
         f"L5 BodyAdj: hem={body_adjusted.hem_from_floor:.1f}\", "
         f"sleeve_delta={body_adjusted.arm_width_delta:+.2f}\", "
@@ -1353,11 +1384,6 @@ def score_garment(
     sil_scores = [r.score for r in active if r.name in sil_names]
     worst_sil = min(sil_scores) if sil_scores else 0.0
 
-    has_slimming = (
-        _has_goal(body, StylingGoal.SLIMMING)
-        or _has_goal(body, StylingGoal.SLIM_HIPS)
-        or _has_goal(body, StylingGoal.HIDE_MIDSECTION)
-    )
     if worst_sil < -0.20 and has_slimming and composite > 0:
         composite = worst_sil * 0.3
         reasoning_chain.append(
@@ -1409,6 +1435,23 @@ def score_garment(
     )
 
 
+def score_garments_batch(
+    garments: List[GarmentProfile],
+    body: BodyProfile,
+    context: Optional[dict] = None,
+) -> List[ScoreResult]:
+    """
+    Score a list of garments against one body profile.
+
+    Intended for catalog ranking, where a single user is scored against
+    many candidate garments. The body-level work in make_scorer() (goal
+    weight boosts, slimming-goal check) is done once and shared by every
+    garment.
+    """
+    scorer = make_scorer(body, context)
+    return [scorer(garment) for garment in garments]
+
+
 # ================================================================
 # HELPERS
 # ================================================================
@@ -355,6 +355,19 @@ class BodyProfile:
         bulge_factor = self.c_upper_arm_max / self.c_forearm_min
         return (prominence_ratio + bulge_factor) / 2
 
+    @property
+    def arm_landmarks(self) -> Tuple[Tuple[float, float], ...]:
+        """Arm circumference landmarks as (inches from shoulder, circumference),
+        shoulder to wrist (domain 2 line ~3213)."""
+        return (
+            (0.0, self.shoulder_width * (math.pi / 4)),  # shoulder ~14-18" circ
+            (self.c_upper_arm_max_position, self.c_upper_arm_max),
+            (self.arm_length * 0.52, self.c_elbow),            # ~12" from shoulder
+            (self.arm_length * 0.65, self.c_forearm_max),
+            (self.c_forearm_min_position, self.c_forearm_min),
+            (self.arm_length, self.c_wrist),
+        )
+
 
 # ================================================================
 # INPUT: GARMENT PROFILE
@@ -467,6 +480,14 @@ class GarmentProfile:
     # --- Skirt-specific ---
     skirt_construction: Optional[str] = None  # a_line | pencil | pleated | wrap | tiered | circle | straight | tulip | asymmetric | slit
 
+    def __post_init__(self):
+        # Accept raw strings for sleeve_type; unknown values fall back to set-in
+        if not isinstance(self.sleeve_type, SleeveType):
+            try:
+                self.sleeve_type = SleeveType(self.sleeve_type)
+            except ValueError:
+                self.sleeve_type = SleeveType.SET_IN
+
     # --- Derived convenience properties ---
     @property
     def is_dark(self) -> bool:
@@ -557,13 +578,13 @@ class Fix:
     priority: int = 1                         # 1=high, 3=low
 
 
-@dataclass
+@dataclass(slots=True)
 class BodyAdjustedGarment:
     """Result of Piece 2 body-garment translation."""
     # Hemline
     hem_from_floor: float = 0.0              # inches
     hem_zone: str = ""                       # above_knee | knee_danger | safe_zone | calf_danger | etc.
-    hemline_danger_zones: List[Tuple[float, float]] = field(default_factory=list)
+    hemline_danger_zones: Tuple[Tuple[float, float], ...] = ()
     hemline_safe_zone: Optional[Tuple[float, float]] = None
     fabric_rise_adjustment: float = 0.0      # inches hemline rises from stated
 
@@ -585,7 +606,7 @@ class BodyAdjustedGarment:
     photo_reality_discount: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreResult:
     """Complete output of the scoring engine."""
     # Overall score
@@ -36,9 +36,27 @@ MONGO_DB = os.environ.get("MONGO_DB_NAME", "kridha-proto-dev")
 
 
 # ================================================================
-# LIFESPAN — MongoDB setup on startup
+# LIFESPAN — MongoDB setup + warm-up on startup
 # ================================================================
 
+def _warm_up() -> None:
+    """Run one default request through the bridge, scorer and communicator.
+
+    Loads lazily-initialized tables (fabric GSM resolution, phrase banks)
+    at startup so the first real request doesn't pay for them.
+    """
+    start = time.time()
+    try:
+        body = build_body_profile({})
+        garment = build_garment_profile({})
+        result = dataclass_to_dict(score_garment(garment, body))
+        generate_communication(result, {}, {})
+    except Exception as e:
+        logger.warning("Warm-up request failed: %s", e, exc_info=True)
+        return
+    logger.info("Warm-up complete in %.0fms", (time.time() - start) * 1000)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Configure MongoDB-backed registry on startup if MONGO_CONNECTION_STRING is set."""
@@ -51,6 +69,7 @@ async def lifespan(app: FastAPI):
         logger.info("No MONGO_CONNECTION_STRING set, using JSON files")
         registry = get_registry()
         logger.info("Registry loaded from JSON: %s", registry.summary())
+    _warm_up()
     yield
 
 
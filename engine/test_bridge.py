@@ -14,6 +14,7 @@ from engine.bridge import (
     build_body_profile,
     build_garment_profile,
     estimate_brand_tier,
+    resolve_fabric_gsm,
     CM_TO_IN,
 )
 from engine.schemas import (
@@ -590,6 +591,32 @@ def test_zone_detection():
     check("jacket -> torso", g.zone, "torso")
 
 
+# ================================================================
+# TEST 13: FABRIC KEYWORD OVERRIDES
+# ================================================================
+
+def test_fabric_keyword_overrides():
+    print("\n=== TEST 13: Fabric Keyword Overrides ===")
+    cases = [
+        ({"title": "Silk Chiffon Blouse", "fabric_primary": "silk", "price": "$120"},
+         40, "keyword:chiffon"),
+        ({"title": "Silk Chiffon Blouse", "fabric_primary": "silk", "price": "$60"},
+         50, "keyword:chiffon"),
+        ({"title": "Stretch Denim Jeans", "stretch_percentage": 2}, 320, "keyword:denim"),
+        ({"title": "Denim Skirt"}, 350, "keyword:denim"),
+        ({"title": "Velvet dress, crushed finish"}, 250, "keyword:velvet"),
+        ({"title": "Power Mesh Top"}, 200, "keyword:mesh"),
+        ({"title": "Mesh Top"}, 100, "keyword:mesh"),
+        # Bare "leather" is skipped in favour of the faux/vegan keyword
+        ({"title": "Vegan Leather Jacket"}, 350, "keyword:vegan leather"),
+        ({"title": "Leather Jacket"}, 500, "keyword:leather"),
+    ]
+    for attrs, gsm, path in cases:
+        result = resolve_fabric_gsm(attrs)
+        check(f"{attrs['title']} gsm", result.gsm, gsm)
+        check(f"{attrs['title']} path", result.resolution_path, path)
+
+
 # ================================================================
 # MAIN
 # ================================================================
@@ -607,6 +634,7 @@ def main():
     test_end_to_end()
     test_pattern_stripes()
     test_zone_detection()
+    test_fabric_keyword_overrides()
 
     print(f"\n{'='*50}")
     print(f"Bridge Tests: {PASS_COUNT} passed, {FAIL_COUNT} failed")
@@ -15,7 +15,7 @@ from engine.schemas import (
     BodyShape, StylingGoal, SkinUndertone,
     FabricConstruction, SurfaceFinish, Silhouette,
     SleeveType, NecklineType, GarmentCategory,
-    TopHemBehavior,
+    TopHemBehavior, BrandTier,
     clamp, score_to_ten,
 )
 from engine.kridha_engine import (
@@ -26,7 +26,7 @@ from engine.kridha_engine import (
     score_vneck_elongation, score_monochrome_column,
     score_hemline, score_sleeve, score_waist_placement,
     score_color_value, score_fabric_zone, score_neckline_compound,
-    score_garment,
+    score_garment, score_garments_batch,
 )
 from engine.body_garment_translator import (
     translate_hemline, translate_sleeve, translate_waistline,
@@ -35,6 +35,7 @@ from engine.body_garment_translator import (
 from engine.context_modifiers import apply_context_modifiers
 from engine.fabric_gate import (
     resolve_fabric_properties, run_fabric_gates, compute_cling_risk,
+    photo_to_reality_discount_batch,
 )
 from engine.rules_data import (
     get_registry, ELASTANE_MULTIPLIERS, FIBER_GSM_MULTIPLIERS,
@@ -545,6 +546,11 @@ def test_piece2_math():
     sleeve = translate_sleeve(g, body)
     check("Sleeve cap near danger zone", sleeve.delta_vs_actual, "+")  # widening
 
+    # Sleeve: string sleeve_type is coerced to the enum
+    g = GarmentProfile(sleeve_type="cap")
+    check("Sleeve string coerced to enum",
+          1.0 if g.sleeve_type is SleeveType.CAP else -1.0, "+")
+
     # Waistline: natural waist
     g = GarmentProfile(waist_position="natural")
     waist = translate_waistline(g, body)
@@ -615,6 +621,15 @@ def test_fabric_gate():
     cling = compute_cling_risk(resolved, zone_circ=38.0, garment_rest_circ=34.0, curvature_rate=0.8)
     check("Cling threshold computation", cling.base_threshold, "+", (10, 50))
 
+    # Photo-to-reality discount: one body gap (0.175 here), scaled per tier
+    body = BodyProfile(bust=34.5, waist=25.5, hip=35.5, c_upper_arm_max=10.5, c_thigh_max=20.5)
+    discounts = photo_to_reality_discount_batch(
+        [GarmentProfile(brand_tier=tier) for tier in BrandTier], body,
+    )
+    check("Photo discount batch: mid-market = body gap", discounts[2], "+", (0.174, 0.176))
+    check("Photo discount batch: luxury < fast fashion",
+          1.0 if discounts == sorted(discounts) and discounts[0] < discounts[-1] else -1.0, "+")
+
     # Fabric lookup
     assert len(FABRIC_LOOKUP) >= 50  # 50 original + new additions
     check("Fabric lookup has 50+ entries", 1.0, "+")
@@ -1358,6 +1373,13 @@ def test_combined_profiles():
     check("CP6a: Pear tucked V-neck top", result_top.composite_raw, "+")
     check("CP6b: Pear high-rise wide-leg pants", result_pants.composite_raw, "+")
 
+    # CP7: Batch scoring matches per-garment scoring, in input order
+    batch = score_garments_batch([g_top, g_pants], body)
+    same = [r.composite_raw for r in batch] == [
+        result_top.composite_raw, result_pants.composite_raw,
+    ]
+    check("CP7: Batch scoring matches score_garment", 1.0 if same else -1.0, "+")
+
 
 # ================================================================
 # MAIN
@@ -1391,14 +1413,14 @@ def run_tests():
         "p1_detections_tested": 27,
         "composite_scenarios": 4,
         "edge_cases": 6,
-        "piece2_math": 9,
+        "piece2_math": 10,
         "fabric_gate": 8,
         "goal_scoring": 4,
         "registry_data": 7,
         "new_scorers_p11_p16": 10,
         "garment_types": 27,
         "fix_validation": 22,
-        "combined_profiles": 8,
+        "combined_profiles": 9,
     }
     print(f"  Coverage: {sum(coverage.values())} test cases across {len(coverage)} sections")
     for section, count in coverage.items():